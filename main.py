@@ -1,3 +1,4 @@
+import gc
 import pygame
 import sys
 import traceback
@@ -5,8 +6,28 @@ from src.config.constants import *
 from src.config.settings import GameSettings
 from src.entities import Player, Asteroid, Shot, Explosion
 from src.systems import AsteroidField, GameState, CollisionSystem, InputSystem
-from src.systems.input_system import InputAction
+from src.systems.input_system import InputAction, ACTION_BITS
 from src.assets import get_asset_manager
+from src.utils.math_utils import merge_rects
+
+# Held-action bits sampled from InputSystem.held_mask each frame
+THRUST_FORWARD_BIT = ACTION_BITS[InputAction.THRUST_FORWARD]
+THRUST_BACKWARD_BIT = ACTION_BITS[InputAction.THRUST_BACKWARD]
+TURN_LEFT_BIT = ACTION_BITS[InputAction.TURN_LEFT]
+TURN_RIGHT_BIT = ACTION_BITS[InputAction.TURN_RIGHT]
+SHOOT_BIT = ACTION_BITS[InputAction.SHOOT]
+
+# The only event types the game reacts to; everything else is blocked at the SDL queue
+HANDLED_EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+
+# Events after which the window contents may be lost and must be fully repainted
+EXPOSE_EVENT_TYPES = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+
+# pygame attributes used every frame, bound once instead of looked up per call
+_QUIT = pygame.QUIT
+_event_get = pygame.event.get
+_display_update = pygame.display.update
+_display_flip = pygame.display.flip
 
 
 class AsteroidsGame:
@@ -20,13 +41,18 @@ class AsteroidsGame:
         # Load settings
         self.settings = GameSettings()
         
-        # Initialize asset manager
-        self.asset_manager = get_asset_manager()
-        
         # Setup display
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Asteroids - Production Edition")
         
+        # Initialize asset manager once the display exists, so surfaces can be
+        # converted to its pixel format
+        self.asset_manager = get_asset_manager()
+        
+        # Keep unhandled events (mouse motion etc.) out of the event queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENT_TYPES)
+        
         # Game clock
         self.clock = pygame.time.Clock()
         
@@ -37,6 +63,7 @@ class AsteroidsGame:
         self.game_state = GameState()
         self.collision_system = CollisionSystem()
         self.input_system = InputSystem()
+        self.input_system.record_history = self.settings.debug_mode
         
         # Setup input callbacks
         self.setup_input_callbacks()
@@ -45,11 +72,15 @@ class AsteroidsGame:
         self.asteroid_field = None
         self.player = None
         
-        # Performance tracking
-        self.frame_count = 0
-        self.fps_timer = 0.0
+        # Performance tracking (debug mode only)
         self.current_fps = 60.0
         
+        # Screen areas drawn last frame, erased and re-presented this frame
+        self.last_dirty_rects = []
+        
+        # Set when the window was uncovered, so the next frame repaints everything
+        self.needs_full_redraw = True
+        
         # Initialize game
         self.start_new_game()
     
@@ -68,12 +99,7 @@ class AsteroidsGame:
     
     def setup_input_callbacks(self):
         """Setup input system callbacks."""
-        # Continuous actions
-        self.input_system.register_callback(InputAction.THRUST_FORWARD, self.player_thrust_forward)
-        self.input_system.register_callback(InputAction.THRUST_BACKWARD, self.player_thrust_backward)
-        self.input_system.register_callback(InputAction.TURN_LEFT, self.player_turn_left)
-        self.input_system.register_callback(InputAction.TURN_RIGHT, self.player_turn_right)
-        self.input_system.register_callback(InputAction.SHOOT, self.player_shoot)
+        # Continuous actions are read from input_system.held_mask in update_game_logic
         
         # Single actions
         self.input_system.register_callback(InputAction.PAUSE, self.toggle_pause)
@@ -98,57 +124,33 @@ class AsteroidsGame:
         self.updatable.add(self.player)
         self.drawable.add(self.player)
         
-        print("New game started!")
-    
-    def player_thrust_forward(self, dt=None):
-        """Player thrust forward callback."""
-        if self.player and not self.game_state.paused:
-            if dt is not None:
-                self.player.move(dt)
-            else:
-                self.player.move(1/60)  # Fallback dt
-    
-    def player_thrust_backward(self, dt=None):
-        """Player thrust backward callback."""
-        if self.player and not self.game_state.paused:
-            if dt is not None:
-                self.player.move(-dt)
-            else:
-                self.player.move(-1/60)  # Fallback dt
+        self.debug_log("New game started!")
     
-    def player_turn_left(self, dt=None):
-        """Player turn left callback."""
-        if self.player and not self.game_state.paused:
-            if dt is not None:
-                self.player.rotate(-dt)
-            else:
-                self.player.rotate(-1/60)  # Fallback dt
-    
-    def player_turn_right(self, dt=None):
-        """Player turn right callback."""
-        if self.player and not self.game_state.paused:
-            if dt is not None:
-                self.player.rotate(dt)
-            else:
-                self.player.rotate(1/60)  # Fallback dt
+    def apply_player_input(self, mask, dt):
+        """Apply the held continuous actions in the given bitmask to the player."""
+        player = self.player
+        thrust = bool(mask & THRUST_FORWARD_BIT) - bool(mask & THRUST_BACKWARD_BIT)
+        turn = bool(mask & TURN_RIGHT_BIT) - bool(mask & TURN_LEFT_BIT)
+        player.apply_input(thrust, turn, dt)
+        
+        if mask & SHOOT_BIT and player.shoot():
+            self.game_state.stats['shots_fired'] += 1
     
-    def player_shoot(self, dt=None):
-        """Player shoot callback."""
-        if self.player and not self.game_state.paused:
-            shot = self.player.shoot()
-            if shot:
-                self.game_state.stats['shots_fired'] += 1
+    def debug_log(self, message):
+        """Print a message only in debug mode, keeping console writes out of normal frames."""
+        if self.settings.debug_mode:
+            print(message)
     
     def player_bomb(self):
         """Player bomb callback."""
         if self.player and not self.game_state.paused:
             # Implement bomb logic here
-            print("Bomb activated!")
+            self.debug_log("Bomb activated!")
     
     def toggle_pause(self):
         """Toggle pause state."""
         self.game_state.pause_toggle()
-        print(f"Game {'paused' if self.game_state.paused else 'unpaused'}")
+        self.debug_log(f"Game {'paused' if self.game_state.paused else 'unpaused'}")
     
     def restart_game(self):
         """Restart the game."""
@@ -162,32 +164,45 @@ class AsteroidsGame:
     
     def handle_events(self):
         """Handle all pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        handle_input_event = self.input_system.handle_event
+        for event in _event_get(HANDLED_EVENT_TYPES):
+            if event.type == _QUIT:
                 self.quit_game()
+            elif event.type in EXPOSE_EVENT_TYPES:
+                self.needs_full_redraw = True
             else:
-                self.input_system.handle_event(event)
+                handle_input_event(event)
     
     def update_game_logic(self, dt):
         """Update all game logic."""
-        if self.game_state.paused or self.game_state.game_over:
+        game_state = self.game_state
+        if game_state.paused or game_state.game_over:
             return
         
         # Update game state
-        self.game_state.update(dt)
+        game_state.update(dt)
         
         # Update input system
-        self.input_system.update(dt)
+        input_system = self.input_system
+        input_system.update(dt)
         
-        # Update all game objects
-        self.updatable.update(dt)
+        # Apply held actions to the player
+        mask = input_system.held_mask
+        if mask and self.player:
+            self.apply_player_input(mask, dt)
+        
+        # Update all game objects; calling update directly skips Group.update's
+        # per-sprite *args/**kwargs forwarding. sprites() returns a copy, so
+        # sprites may kill themselves or spawn others during the loop
+        for sprite in self.updatable.sprites():
+            sprite.update(dt)
         
         # Handle collisions
         self.handle_collisions()
         
         # Check for wave completion
-        if len(self.asteroids) == 0 and not self.game_state.wave_complete:
-            self.game_state.complete_wave()
+        if not self.asteroids and not game_state.wave_complete:
+            game_state.complete_wave()
     
     def handle_collisions(self):
         """Handle all collision detection and response."""
@@ -196,7 +211,14 @@ class AsteroidsGame:
             self.shots, self.asteroids
         )
         
+        # An asteroid hit by several shots is only split once; split() recycles it,
+        # so later pairs would otherwise see a reused asteroid
+        handled = set()
         for shot, asteroid in shot_asteroid_collisions:
+            if asteroid in handled:
+                continue
+            handled.add(asteroid)
+            
             # Add explosion
             self.game_state.add_explosion(asteroid.position.x, asteroid.position.y)
             
@@ -211,12 +233,13 @@ class AsteroidsGame:
             asteroid.split()
         
         # Check player-asteroid collisions (only if not respawning)
-        if self.player and not self.player.is_respawning:
+        player = self.player
+        if player and not player.is_respawning:
             player_asteroid_collisions = self.collision_system.check_collisions_between_groups(
-                [self.player], self.asteroids
+                [player], self.asteroids
             )
             
-            for player, asteroid in player_asteroid_collisions:
+            for _, asteroid in player_asteroid_collisions:
                 if player.take_damage():
                     # Add explosion at player position
                     self.game_state.add_explosion(player.position.x, player.position.y, "large")
@@ -228,30 +251,57 @@ class AsteroidsGame:
     
     def render(self):
         """Render all game graphics."""
-        # Clear screen
-        self.screen.fill("black")
+        screen = self.screen
+        full_redraw = self.needs_full_redraw
         
-        # Draw all drawable objects
+        # Erase only what was drawn last frame instead of clearing the whole screen,
+        # unless the window lost its contents
+        if full_redraw:
+            screen.fill("black")
+        else:
+            for rect in self.last_dirty_rects:
+                screen.fill("black", rect)
+        
+        dirty_rects = []
+        
+        # Draw all drawable objects, batching sprite blits into one call
+        blit_sequence = []
         for obj in self.drawable:
-            obj.draw(self.screen)
+            blit = obj.blit_tuple()
+            if blit:
+                blit_sequence.append(blit)
+            else:
+                rect = obj.draw(screen)
+                if rect:
+                    dirty_rects.append(rect)
+        dirty_rects.extend(screen.blits(blit_sequence))
         
         # Draw explosions
-        self.game_state.draw_explosions(self.screen)
+        dirty_rects.extend(self.game_state.draw_explosions(screen))
         
         # Draw UI
-        self.game_state.draw_ui(self.screen, self.player)
+        dirty_rects.extend(self.game_state.draw_ui(screen, self.player))
         
         # Draw performance info if enabled
         if self.settings.debug_mode:
-            self.draw_debug_info()
+            dirty_rects.extend(self.draw_debug_info())
         
         # Update display
-        pygame.display.flip()
+        if full_redraw:
+            _display_flip()
+            self.needs_full_redraw = False
+        else:
+            # Present both the erased and the newly drawn areas; a sprite's old and
+            # new positions usually overlap, so merging cuts the rect count
+            update_rects = merge_rects(self.last_dirty_rects + dirty_rects)
+            if len(update_rects) < DIRTY_RECT_LIMIT:
+                _display_update(update_rects)
+            else:
+                _display_flip()
+        self.last_dirty_rects = dirty_rects
     
     def draw_debug_info(self):
-        """Draw debug information."""
-        font = pygame.font.Font(None, 24)
-        
+        """Draw debug information and return the screen areas it covered."""
         debug_info = [
             f"FPS: {self.current_fps:.1f}",
             f"Asteroids: {len(self.asteroids)}",
@@ -259,20 +309,19 @@ class AsteroidsGame:
             f"Input: {self.input_system.get_input_string()}",
         ]
         
+        # Lines whose text is unchanged come back from the asset manager's text cache
+        create_text_surface = self.asset_manager.create_text_surface
+        dirty_rects = []
         y_offset = SCREEN_HEIGHT - 120
         for i, info in enumerate(debug_info):
-            text = font.render(info, True, "green")
-            self.screen.blit(text, (10, y_offset + i * 25))
+            text = create_text_surface(info, "small", "green")
+            dirty_rects.append(self.screen.blit(text, (10, y_offset + i * 25)))
+        return dirty_rects
     
     def update_performance_tracking(self, dt):
-        """Update performance tracking."""
-        self.frame_count += 1
-        self.fps_timer += dt
-        
-        if self.fps_timer >= 1.0:  # Update FPS every second
-            self.current_fps = self.frame_count / self.fps_timer
-            self.frame_count = 0
-            self.fps_timer = 0.0
+        """Fold the last frame time into the FPS exponential moving average."""
+        if dt > 0:
+            self.current_fps = 0.95 * self.current_fps + 0.05 / dt
     
     def run(self):
         """Main game loop."""
@@ -281,24 +330,46 @@ class AsteroidsGame:
         print("Controls: WASD/Arrows to move, Space to shoot, P to pause, ESC to quit")
         
         dt = 0
+        accumulator = 0.0
+        max_lag = PHYSICS_STEP * MAX_PHYSICS_STEPS
         running = True
         
+        # Bind per-frame lookups to locals once, outside the loop
+        handle_events = self.handle_events
+        update_game_logic = self.update_game_logic
+        render = self.render
+        update_performance_tracking = self.update_performance_tracking
+        settings = self.settings
+        tick = self.clock.tick
+        fps = settings.FPS
+        
+        # Move everything allocated at startup (assets, caches) out of the
+        # collector's view so collections during play only scan new objects
+        gc.collect()
+        gc.freeze()
+        
         try:
             while running:
                 # Handle events
-                self.handle_events()
+                handle_events()
                 
-                # Update game logic
-                self.update_game_logic(dt)
+                # Update game logic in fixed steps so physics doesn't depend on frame rate
+                while accumulator >= PHYSICS_STEP:
+                    update_game_logic(PHYSICS_STEP)
+                    accumulator -= PHYSICS_STEP
                 
                 # Render graphics
-                self.render()
+                render()
                 
-                # Update performance tracking
-                self.update_performance_tracking(dt)
+                # Update performance tracking; the FPS is only shown in debug mode
+                if settings.debug_mode:
+                    update_performance_tracking(dt)
                 
                 # Control frame rate
-                dt = self.clock.tick(self.settings.FPS) / 1000.0
+                dt = tick(fps) / 1000.0
+                
+                # Drop lag we can't catch up on instead of spiralling after a stall
+                accumulator = min(accumulator + dt, max_lag)
                 
         except KeyboardInterrupt:
             print("\nGame interrupted by user")
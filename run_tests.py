@@ -15,7 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import test modules
 from tests.test_entities import TestEntities
-from tests.test_systems import TestGameState, TestCollisionSystem, TestInputSystem
+from tests.test_systems import TestGameState, TestCollisionSystem, TestInputSystem, TestRendering, TestMathUtils
 
 
 class ColoredTextTestResult(unittest.TextTestResult):
@@ -84,7 +84,9 @@ class AsteroidsTestRunner:
             TestEntities,
             TestGameState,
             TestCollisionSystem,
-            TestInputSystem
+            TestInputSystem,
+            TestRendering,
+            TestMathUtils
         ]
         
         for test_class in test_classes:
@@ -6,9 +6,22 @@ Handles loading, caching, and management of all game assets.
 import pygame
 import os
 import json
-from typing import Dict, Optional, Tuple
+import random
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    from ..utils.math_utils import unit_circle_points
+except ImportError:
+    # view_assets.py puts src on sys.path and imports this package as top-level "assets"
+    from utils.math_utils import unit_circle_points
+
+# Most rendered text surfaces kept by create_text_surface
+TEXT_CACHE_SIZE = 256
+
+# Point sizes of the named default fonts, loaded on first use by get_font
+FONT_SIZES = {"small": 24, "medium": 36, "large": 48, "huge": 72}
+
 
 class AssetManager:
     """Centralized asset management system."""
@@ -18,22 +31,27 @@ class AssetManager:
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.fonts: Dict[str, pygame.font.Font] = {}
         
+        # Pre-rendered variants of the base images
+        self.rotated_images: Dict[str, List[pygame.Surface]] = {}
+        self.sized_images: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+        self.text_surfaces: Dict[Tuple[str, str, Union[str, Tuple[int, int, int]]], pygame.Surface] = {}
+        
+        # Bumped by reload_assets, so caches outside the manager can tell their surfaces are stale
+        self.generation = 0
+        
         # Asset paths
         self.base_path = Path(__file__).parent
         self.images_path = self.base_path / "images"
         self.sounds_path = self.base_path / "sounds"
         
-        # Ensure directories exist
-        self.images_path.mkdir(exist_ok=True)
-        self.sounds_path.mkdir(exist_ok=True)
-        
         # Asset definitions
         self.asset_definitions = {
             "player": {
                 "type": "procedural",
                 "size": (30, 30),
                 "color": (255, 255, 255),
-                "shape": "triangle"
+                "shape": "triangle",
+                "rotation_steps": 180  # Pre-rendered every 2 degrees
             },
             "asteroid_large": {
                 "type": "procedural", 
@@ -84,12 +102,11 @@ class AssetManager:
                 self.images[asset_name] = self.generate_procedural_image(asset_name, definition)
             else:
                 self.load_image(asset_name, definition.get("file"))
-        
-        # Load fonts
-        self.load_fonts()
+            
+            if "rotation_steps" in definition and asset_name in self.images:
+                self.build_rotation_cache(asset_name, definition["rotation_steps"])
         
         print(f"✓ Loaded {len(self.images)} images")
-        print(f"✓ Loaded {len(self.fonts)} fonts")
     
     def generate_procedural_image(self, name: str, definition: dict) -> pygame.Surface:
         """Generate a procedural image based on definition."""
@@ -114,9 +131,6 @@ class AssetManager:
             
         elif shape == "lumpy_circle":
             # Lumpy asteroid
-            import math
-            import random
-            
             # Set seed based on name for consistent generation
             random.seed(hash(name) % 1000)
             
@@ -124,13 +138,10 @@ class AssetManager:
             points = []
             num_points = 12
             
-            for i in range(num_points):
-                angle = (2 * math.pi * i) / num_points
+            for cos_a, sin_a in unit_circle_points(num_points):
                 # Add some randomness to radius for lumpy effect
                 r = radius + random.randint(-radius//4, radius//4)
-                x = center_x + int(r * math.cos(angle))
-                y = center_y + int(r * math.sin(angle))
-                points.append((x, y))
+                points.append((center_x + int(r * cos_a), center_y + int(r * sin_a)))
             
             pygame.draw.polygon(surface, color, points, 2)
             
@@ -141,22 +152,15 @@ class AssetManager:
             
         elif shape == "star":
             # Star shape for explosions
-            import math
-            
             outer_radius = min(size) // 2 - 2
             inner_radius = outer_radius // 2
             points = []
             num_points = 8
             
-            for i in range(num_points * 2):
-                angle = (2 * math.pi * i) / (num_points * 2)
-                if i % 2 == 0:
-                    r = outer_radius
-                else:
-                    r = inner_radius
-                x = center_x + int(r * math.cos(angle))
-                y = center_y + int(r * math.sin(angle))
-                points.append((x, y))
+            for i, (cos_a, sin_a) in enumerate(unit_circle_points(num_points * 2)):
+                # Alternate between the outer tips and inner corners
+                r = outer_radius if i % 2 == 0 else inner_radius
+                points.append((center_x + int(r * cos_a), center_y + int(r * sin_a)))
             
             pygame.draw.polygon(surface, color, points)
             
@@ -170,9 +174,14 @@ class AssetManager:
             ]
             pygame.draw.polygon(surface, color, points, 2)
         
-        # Save the generated image
-        image_path = self.images_path / f"{name}.png"
-        pygame.image.save(surface, str(image_path))
+        # Only write the generated image to disk when asked to (for inspecting sprites)
+        if os.environ.get("ASTEROIDS_DUMP_SPRITES"):
+            self.images_path.mkdir(exist_ok=True)
+            pygame.image.save(surface, str(self.images_path / f"{name}.png"))
+        
+        # Match the display's pixel format once so blits don't convert per pixel
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
         
         return surface
     
@@ -193,29 +202,17 @@ class AssetManager:
         
         return None
     
-    def load_fonts(self):
-        """Load game fonts."""
-        try:
-            # Default system fonts
-            self.fonts["small"] = pygame.font.Font(None, 24)
-            self.fonts["medium"] = pygame.font.Font(None, 36)
-            self.fonts["large"] = pygame.font.Font(None, 48)
-            self.fonts["huge"] = pygame.font.Font(None, 72)
-        except Exception as e:
-            print(f"Warning: Could not load fonts: {e}")
-            # Fallback to default font
-            self.fonts["small"] = pygame.font.Font(None, 24)
-            self.fonts["medium"] = pygame.font.Font(None, 36)
-            self.fonts["large"] = pygame.font.Font(None, 48)
-            self.fonts["huge"] = pygame.font.Font(None, 72)
-    
     def get_image(self, name: str) -> Optional[pygame.Surface]:
         """Get an image by name."""
         return self.images.get(name)
     
     def get_font(self, name: str) -> Optional[pygame.font.Font]:
-        """Get a font by name."""
-        return self.fonts.get(name)
+        """Get a font by name, loading it the first time it is requested."""
+        font = self.fonts.get(name)
+        if font is None and name in FONT_SIZES:
+            font = pygame.font.Font(None, FONT_SIZES[name])
+            self.fonts[name] = font
+        return font
     
     def get_scaled_image(self, name: str, scale: float) -> Optional[pygame.Surface]:
         """Get a scaled version of an image."""
@@ -226,28 +223,61 @@ class AssetManager:
         new_size = (int(original.get_width() * scale), int(original.get_height() * scale))
         return pygame.transform.scale(original, new_size)
     
-    def get_rotated_image(self, name: str, angle: float) -> Optional[pygame.Surface]:
-        """Get a rotated version of an image."""
-        original = self.get_image(name)
-        if original is None:
-            return None
-        
-        return pygame.transform.rotate(original, angle)
+    def get_sized_image(self, name: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Get a version of an image scaled to an exact size, cached per size."""
+        key = (name, size)
+        surface = self.sized_images.get(key)
+        if surface is None:
+            original = self.get_image(name)
+            if original is None:
+                return None
+            # Scaling happens once per size, so use the higher quality filter
+            surface = pygame.transform.smoothscale(original, size)
+            self.sized_images[key] = surface
+        return surface
+    
+    def build_rotation_cache(self, name: str, steps: int):
+        """Pre-render an image at evenly spaced rotation angles."""
+        original = self.images[name]
+        self.rotated_images[name] = [
+            pygame.transform.rotate(original, i * 360 / steps) for i in range(steps)
+        ]
+    
+    def get_rotation_frames(self, name: str) -> Optional[List[pygame.Surface]]:
+        """Get the pre-rendered rotations of an image defined with "rotation_steps", evenly spaced from 0 degrees."""
+        return self.rotated_images.get(name)
     
     def create_text_surface(self, text: str, font_name: str = "medium", 
-                           color: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Surface:
-        """Create a text surface."""
+                           color: Union[str, Tuple[int, int, int]] = (255, 255, 255)) -> pygame.Surface:
+        """Create a text surface, reusing the cached one for text rendered before."""
+        key = (text, font_name, color)
+        surface = self.text_surfaces.get(key)
+        if surface is not None:
+            return surface
+        
         font = self.get_font(font_name)
         if font is None:
             font = pygame.font.Font(None, 36)  # Fallback
         
-        return font.render(text, True, color)
+        # Evict the oldest entry once full; dicts keep insertion order
+        if len(self.text_surfaces) >= TEXT_CACHE_SIZE:
+            del self.text_surfaces[next(iter(self.text_surfaces))]
+        
+        surface = font.render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.text_surfaces[key] = surface
+        return surface
     
     def reload_assets(self):
         """Reload all assets (useful for development)."""
         self.images.clear()
         self.sounds.clear()
         self.fonts.clear()
+        self.rotated_images.clear()
+        self.sized_images.clear()
+        self.text_surfaces.clear()
+        self.generation += 1
         self.load_all_assets()
     
     def list_assets(self):
@@ -6,6 +6,7 @@ ASTEROID_MIN_RADIUS = 20
 ASTEROID_KINDS = 3
 ASTEROID_SPAWN_RATE = 3.0  # Spawn a new asteroid every 3 seconds
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS
+ASTEROID_POOL_SIZE = 64  # Killed asteroids kept around for reuse
 
 # Player settings
 PLAYER_RADIUS = 20
@@ -18,6 +19,8 @@ PLAYER_RESPAWN_TIME = 2.0  # seconds
 SHOT_RADIUS = 3  # Smaller bullets
 PLAYER_SHOOT_SPEED = 600  # Faster bullets
 PLAYER_SHOOT_COOLDOWN = 0.15  # Add cooldown for better gameplay
+SHOT_LIFETIME = 3.0  # seconds
+SHOT_POOL_SIZE = 256  # Killed shots kept around for reuse
 
 # Scoring system
 SCORE_LARGE_ASTEROID = 20
@@ -27,3 +30,16 @@ SCORE_SMALL_ASTEROID = 100
 # Explosion settings
 EXPLOSION_DURATION = 0.5  # seconds
 EXPLOSION_PARTICLES = 8
+EXPLOSION_POOL_SIZE = 32  # Finished explosions kept around for reuse
+EXPLOSION_ANIMATION_FRAMES = 24  # Pre-rendered grow-and-fade frames of the explosion sprite
+
+# Collision settings
+COLLISION_CELL_SIZE = ASTEROID_MAX_RADIUS * 2  # Spatial hash cell size
+SPATIAL_HASH_THRESHOLD = 32  # Brute force is faster below this many asteroids
+
+# Simulation settings
+PHYSICS_STEP = 1 / 60  # Fixed simulation timestep in seconds
+MAX_PHYSICS_STEPS = 5  # Most steps run per frame before dropping lag
+
+# Rendering settings
+DIRTY_RECT_LIMIT = 50  # Above this many dirty rects a full flip is cheaper
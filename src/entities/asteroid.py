@@ -1,55 +1,59 @@
 import pygame
-from .circleshape import CircleShape
+from .circleshape import CircleShape, get_asset_manager
 from ..config.constants import *
 import random
 
 class Asteroid(CircleShape):
+    # Killed asteroids waiting to be reused by spawn()
+    _pool = []
+    _pool_size = ASTEROID_POOL_SIZE
+
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
         self._sprite_image = None
-        self._load_sprite()
+        self._apply_size()
 
-    def _load_sprite(self):
-        """Load the appropriate asteroid sprite based on size."""
-        try:
-            from ..assets import get_asset_manager
-            asset_manager = get_asset_manager()
-            
-            # Choose sprite based on size
-            if self.radius >= ASTEROID_MAX_RADIUS:
-                self._sprite_image = asset_manager.get_image("asteroid_large")
-            elif self.radius >= ASTEROID_MIN_RADIUS * 2:
-                self._sprite_image = asset_manager.get_image("asteroid_medium")
-            else:
-                self._sprite_image = asset_manager.get_image("asteroid_small")
-        except ImportError:
+    def reset(self, x, y, radius):
+        """Reinitialize a pooled asteroid and put it back in its containers."""
+        self.radius = radius
+        self._apply_size()
+        super().reset(x, y)
+
+    def _apply_size(self):
+        """Resolve the sprite and score for the current radius."""
+        # Radius is fixed for an asteroid's lifetime, so this only reruns on reset
+        if self.radius >= ASTEROID_MAX_RADIUS:
+            sprite_name, self._score_value = "asteroid_large", SCORE_LARGE_ASTEROID
+        elif self.radius >= ASTEROID_MIN_RADIUS * 2:
+            sprite_name, self._score_value = "asteroid_medium", SCORE_MEDIUM_ASTEROID
+        else:
+            sprite_name, self._score_value = "asteroid_small", SCORE_SMALL_ASTEROID
+        
+        self._load_sprite(sprite_name)
+
+    def _load_sprite(self, sprite_name):
+        """Load the given asteroid sprite, pre-scaled to this asteroid's size."""
+        if get_asset_manager is None:
             self._sprite_image = None
+            return
+        
+        # Scale once here rather than per draw
+        diameter = int(self.radius * 2)
+        self._sprite_image = get_asset_manager().get_sized_image(sprite_name, (diameter, diameter))
 
-    def draw(self, screen):
+    def blit_tuple(self):
+        """Get the (surface, rect) pair used to draw this asteroid."""
         if self._sprite_image:
-            # Use sprite image if available
-            try:
-                from ..assets import get_asset_manager
-                asset_manager = get_asset_manager()
-                
-                # Scale the image to match the asteroid size
-                scale = (self.radius * 2) / self._sprite_image.get_width()
-                scaled_image = asset_manager.get_scaled_image(
-                    "asteroid_large" if self.radius >= ASTEROID_MAX_RADIUS else
-                    "asteroid_medium" if self.radius >= ASTEROID_MIN_RADIUS * 2 else
-                    "asteroid_small", 
-                    scale
-                )
-                
-                if scaled_image:
-                    rect = scaled_image.get_rect(center=self.position)
-                    screen.blit(scaled_image, rect)
-                    return
-            except ImportError:
-                pass
+            return self._sprite_image, self._sprite_image.get_rect(center=self.position)
+        return None
+
+    def draw(self, screen):
+        blit = self.blit_tuple()
+        if blit:
+            return screen.blit(*blit)
         
         # Fallback to drawing circle
-        pygame.draw.circle(screen, "white", self.position, self.radius, 2)
+        return pygame.draw.circle(screen, "white", self.position, self.radius, 2)
 
     def update(self, dt):
         self.position += self.velocity * dt
@@ -58,27 +62,26 @@ class Asteroid(CircleShape):
 
     def get_score_value(self):
         """Return score value based on asteroid size"""
-        if self.radius >= ASTEROID_MAX_RADIUS:
-            return SCORE_LARGE_ASTEROID
-        elif self.radius >= ASTEROID_MIN_RADIUS * 2:
-            return SCORE_MEDIUM_ASTEROID
-        else:
-            return SCORE_SMALL_ASTEROID
+        return self._score_value
 
     def split(self):
+        # Read everything needed first; once killed, this asteroid may be reused by spawn()
+        x, y = self.position
+        radius = self.radius
+        velocity = self.velocity
         self.kill()
-        if self.radius <= ASTEROID_MIN_RADIUS:
+        if radius <= ASTEROID_MIN_RADIUS:
             return
 
         angle = random.uniform(20, 50)
-        a = self.velocity.rotate(angle)
-        b = self.velocity.rotate(-angle)
-        new_radius = self.radius - ASTEROID_MIN_RADIUS
+        a = velocity.rotate(angle)
+        b = velocity.rotate(-angle)
+        new_radius = radius - ASTEROID_MIN_RADIUS
 
-        new_asteroid1 = Asteroid(self.position.x, self.position.y, new_radius)
+        new_asteroid1 = Asteroid.spawn(x, y, new_radius)
         new_asteroid1.velocity = a * 1.2
 
-        new_asteroid2 = Asteroid(self.position.x, self.position.y, new_radius)
+        new_asteroid2 = Asteroid.spawn(x, y, new_radius)
         new_asteroid2.velocity = b * 1.2
 
             
@@ -42,7 +42,7 @@ class BaseEntity(pygame.sprite.Sprite, ABC):
     
     def wrap_around_screen(self) -> None:
         """Make the entity wrap around screen edges."""
-        self.position = wrap_position(self.position, SCREEN_WIDTH, SCREEN_HEIGHT, self.radius)
+        wrap_position(self.position, SCREEN_WIDTH, SCREEN_HEIGHT, self.radius, out=self.position)
     
     def is_off_screen(self, margin: float = 100) -> bool:
         """Check if entity is off screen with margin."""
@@ -1,9 +1,19 @@
 import pygame
 from ..config.constants import *
 
+# Resolved once here for all entities; without it they fall back to outline drawing
+try:
+    from ..assets import get_asset_manager
+except ImportError:
+    get_asset_manager = None
+
 
 # Base class for game objects
 class CircleShape(pygame.sprite.Sprite):
+    # Classes that recycle instances through spawn() set their own list and size
+    _pool = None
+    _pool_size = 0
+
     def __init__(self, x, y, radius):
         # we will be using this later
         if hasattr(self, "containers"):
@@ -15,27 +25,69 @@ class CircleShape(pygame.sprite.Sprite):
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
 
+    @property
+    def rect(self):
+        """Bounding box of the circle, as expected by pygame's sprite helpers."""
+        return pygame.Rect(self.position.x - self.radius, self.position.y - self.radius,
+                           self.radius * 2, self.radius * 2)
+
+    @classmethod
+    def spawn(cls, *args):
+        """Create an instance, reusing a recycled one when the class keeps a pool."""
+        if cls._pool:
+            entity = cls._pool.pop()
+            entity.reset(*args)
+            return entity
+        return cls(*args)
+
+    def reset(self, x, y):
+        """Reinitialize a recycled instance and put it back in its containers."""
+        self.position.update(x, y)
+        self.velocity.update(0, 0)
+        if hasattr(self, "containers"):
+            self.add(self.containers)
+
+    def recycle(self):
+        """Hand this instance back to its class pool for reuse by spawn()."""
+        pool = self._pool
+        if pool is not None and len(pool) < self._pool_size:
+            pool.append(self)
+
+    def kill(self):
+        # Only recycle live sprites so the same one can never be pooled twice
+        if self.alive():
+            self.recycle()
+        super().kill()
+
     def draw(self, screen):
         # sub-classes must override
         pass
 
+    def blit_tuple(self):
+        """Get the (surface, rect) pair to batch-blit, or None to use draw()."""
+        return None
+
     def update(self, dt):
         # sub-classes must override
         pass
 
     def wrap_around_screen(self):
         """Make objects wrap around screen edges"""
+        position = self.position
+        radius = self.radius
+        x, y = position
+        
         # Wrap horizontally
-        if self.position.x < -self.radius:
-            self.position.x = SCREEN_WIDTH + self.radius
-        elif self.position.x > SCREEN_WIDTH + self.radius:
-            self.position.x = -self.radius
+        if x < -radius:
+            position.x = SCREEN_WIDTH + radius
+        elif x > SCREEN_WIDTH + radius:
+            position.x = -radius
         
         # Wrap vertically
-        if self.position.y < -self.radius:
-            self.position.y = SCREEN_HEIGHT + self.radius
-        elif self.position.y > SCREEN_HEIGHT + self.radius:
-            self.position.y = -self.radius
+        if y < -radius:
+            position.y = SCREEN_HEIGHT + radius
+        elif y > SCREEN_HEIGHT + radius:
+            position.y = -radius
 
     def check_collision_of_asteroid_with_player(self, circleshape):
         distance = self.position.distance_to(circleshape.position)
@@ -1,13 +1,72 @@
 import pygame
 import random
 import math
-from .circleshape import CircleShape
+from .circleshape import CircleShape, get_asset_manager
+from ..config.constants import EXPLOSION_POOL_SIZE, EXPLOSION_ANIMATION_FRAMES
+
+# Explosion radius for each size name
+_RADIUS_BY_SIZE = {"small": 15, "medium": 25, "large": 40}
+
+# Unit (cos, sin) vectors for particle directions, one per degree
+_PARTICLE_DIRECTIONS = [(math.cos(i * math.tau / 360), math.sin(i * math.tau / 360)) for i in range(360)]
+
+_PARTICLE_COLORS = [
+    (255, 255, 0),   # Yellow
+    (255, 165, 0),   # Orange  
+    (255, 69, 0),    # Red-orange
+    (255, 255, 255), # White
+]
+
+# Pre-rendered particle circles keyed by (color, radius)
+_particle_images = {}
+
+
+# Pre-rendered animation frames keyed by the source sprite, for the asset
+# manager generation (see AssetManager.reload_assets) those sprites belong to
+_animation_frames = {}
+_animation_generation = None
+
+
+def _animation(image, generation):
+    """Get the grow-and-fade frames for an explosion sprite, rendering them once per asset load."""
+    global _animation_generation
+    if generation != _animation_generation:
+        # Assets were reloaded, so frames made from the old sprites are never used again
+        _animation_frames.clear()
+        _animation_generation = generation
+    
+    frames = _animation_frames.get(image)
+    if frames is None:
+        frames = []
+        width, height = image.get_size()
+        for i in range(EXPLOSION_ANIMATION_FRAMES):
+            progress = i / EXPLOSION_ANIMATION_FRAMES
+            scale = 0.5 + progress * 1.5  # Grows from 0.5x to 2x size
+            frame = pygame.transform.scale(image, (int(width * scale), int(height * scale)))
+            frame.set_alpha(int(255 * (1 - progress)))  # Fade out
+            frames.append(frame)
+        _animation_frames[image] = frames
+    return frames
+
+
+def _particle_image(color, radius):
+    """Get a cached circle surface for drawing a particle."""
+    key = (color, radius)
+    image = _particle_images.get(key)
+    if image is None:
+        image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(image, color, (radius, radius), radius)
+        _particle_images[key] = image
+    return image
 
 class Explosion(CircleShape):
+    # Finished explosions waiting to be reused by spawn()
+    _pool = []
+    _pool_size = EXPLOSION_POOL_SIZE
+    
     def __init__(self, x, y, size="medium"):
         # Set radius based on size
-        size_map = {"small": 15, "medium": 25, "large": 40}
-        radius = size_map.get(size, 25)
+        radius = _RADIUS_BY_SIZE.get(size, 25)
         
         super().__init__(x, y, radius)
         self.size = size
@@ -22,14 +81,31 @@ class Explosion(CircleShape):
         # Create particles
         self._create_particles()
 
+    def reset(self, x, y, size="medium"):
+        """Restart a pooled explosion at a new position."""
+        super().reset(x, y)
+        self.radius = _RADIUS_BY_SIZE.get(size, 25)
+        self.size = size
+        self.lifetime = self.max_lifetime
+        self.particles = []
+        self._create_particles()
+        
+        # Pick up the new sprite if assets were reloaded while this explosion was pooled
+        if get_asset_manager is not None and self._sprite_generation != get_asset_manager().generation:
+            self._load_sprite()
+
     def _load_sprite(self):
         """Load the explosion sprite from asset manager."""
-        try:
-            from ..assets import get_asset_manager
-            asset_manager = get_asset_manager()
-            self._sprite_image = asset_manager.get_image("explosion")
-        except ImportError:
+        if get_asset_manager is None:
             self._sprite_image = None
+            self._frames = None
+            self._sprite_generation = None
+            return
+        
+        asset_manager = get_asset_manager()
+        self._sprite_generation = asset_manager.generation
+        self._sprite_image = asset_manager.get_image("explosion")
+        self._frames = _animation(self._sprite_image, asset_manager.generation) if self._sprite_image else None
 
     def _create_particles(self):
         """Create explosion particles."""
@@ -37,37 +113,34 @@ class Explosion(CircleShape):
         size_map = {"small": 8, "medium": 12, "large": 20, "normal": 12}
         num_particles = size_map.get(self.size, 12)
         
+        # Each particle is a flat (x, y, vx, vy, size, lifetime, color) tuple
+        x, y = self.position
         for _ in range(num_particles):
-            angle = random.uniform(0, 2 * math.pi)
+            cos_a, sin_a = _PARTICLE_DIRECTIONS[int(random.random() * 360)]
             speed = random.uniform(30, 80)
-            velocity = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
             
-            particle = {
-                'position': pygame.Vector2(self.position),
-                'velocity': velocity,
-                'color': random.choice([
-                    (255, 255, 0),   # Yellow
-                    (255, 165, 0),   # Orange  
-                    (255, 69, 0),    # Red-orange
-                    (255, 255, 255), # White
-                ]),
-                'size': random.uniform(2, 4),
-                'lifetime': random.uniform(0.3, 0.8)
-            }
-            self.particles.append(particle)
+            self.particles.append((
+                x,
+                y,
+                cos_a * speed,
+                sin_a * speed,
+                random.uniform(2, 4),
+                random.uniform(0.3, 0.8),
+                random.choice(_PARTICLE_COLORS),
+            ))
 
     def update(self, dt):
         self.lifetime -= dt
         
-        # Update particles
-        for particle in self.particles[:]:  # Copy list to avoid modification during iteration
-            particle['position'] += particle['velocity'] * dt
-            particle['lifetime'] -= dt
-            particle['size'] *= 0.98  # Shrink over time
-            
-            # Remove dead particles
-            if particle['lifetime'] <= 0 or particle['size'] < 0.5:
-                self.particles.remove(particle)
+        # Update particles, keeping only the live ones in a single pass
+        particles = []
+        append = particles.append
+        for x, y, vx, vy, size, lifetime, color in self.particles:
+            lifetime -= dt
+            size *= 0.98  # Shrink over time
+            if lifetime > 0 and size >= 0.5:
+                append((x + vx * dt, y + vy * dt, vx, vy, size, lifetime, color))
+        self.particles = particles
         
         # Remove explosion when done
         if self.lifetime <= 0:
@@ -79,32 +152,21 @@ class Explosion(CircleShape):
 
     def draw(self, screen):
         if self._sprite_image:
-            # Use sprite image if available - scale based on animation progress
-            progress = 1 - (self.lifetime / self.max_lifetime)
-            scale = 0.5 + progress * 1.5  # Grows from 0.5x to 2x size
-            alpha = int(255 * (self.lifetime / self.max_lifetime))  # Fade out
+            # Use sprite image if available - pick the frame for the animation progress
+            if self.lifetime <= 0:
+                return None  # Fully faded out
             
-            try:
-                from ..assets import get_asset_manager
-                asset_manager = get_asset_manager()
-                scaled_image = asset_manager.get_scaled_image("explosion", scale)
-                
-                if scaled_image:
-                    # Apply alpha
-                    temp_surface = scaled_image.copy()
-                    temp_surface.set_alpha(alpha)
-                    rect = temp_surface.get_rect(center=self.position)
-                    screen.blit(temp_surface, rect)
-                    return
-            except ImportError:
-                pass
+            progress = 1 - (self.lifetime / self.max_lifetime)
+            frames = self._frames
+            frame = frames[min(int(progress * len(frames)), len(frames) - 1)]
+            return screen.blit(frame, frame.get_rect(center=self.position))
+        
+        # Fallback: Draw particles from cached circle sprites in one batched call
+        blit_sequence = []
+        for x, y, _, _, size, _, color in self.particles:
+            radius = int(size)
+            if radius > 0:
+                blit_sequence.append((_particle_image(color, radius), (x - radius, y - radius)))
         
-        # Fallback: Draw particles
-        for particle in self.particles:
-            if particle['size'] > 0:
-                pygame.draw.circle(
-                    screen, 
-                    particle['color'], 
-                    particle['position'], 
-                    int(particle['size'])
-                ) 
\ No newline at end of file
+        rects = screen.blits(blit_sequence)
+        return rects[0].unionall(rects[1:]) if rects else None 
\ No newline at end of file
@@ -3,7 +3,7 @@ Player entity for the Asteroids game.
 """
 
 import pygame
-from .circleshape import CircleShape
+from .circleshape import CircleShape, get_asset_manager
 from .shot import Shot
 from ..config.constants import *
 
@@ -14,6 +14,7 @@ class Player(CircleShape):
     def __init__(self, x, y):
         super().__init__(x, y, PLAYER_RADIUS)
         self.rotation = 0
+        self.forward = pygame.Vector2(0, -1)  # Unit heading, kept in sync with rotation
         self.velocity = pygame.Vector2(0, 0)
         self.shoot_cooldown = 0
         self.lives = PLAYER_LIVES
@@ -23,58 +24,84 @@ class Player(CircleShape):
         
         # Asset management
         self._sprite_image = None
+        self._rotation_frames = None
         self._load_sprite()
 
     def _load_sprite(self):
-        """Load the player sprite from asset manager."""
-        try:
-            from ..assets import get_asset_manager
-            asset_manager = get_asset_manager()
-            self._sprite_image = asset_manager.get_image("player")
-        except ImportError:
+        """Load the player sprite and its pre-rendered rotations from asset manager."""
+        if get_asset_manager is None:
             # Fallback if asset manager is not available
             self._sprite_image = None
+            self._rotation_frames = None
+            return
+        
+        asset_manager = get_asset_manager()
+        self._sprite_image = asset_manager.get_image("player")
+        self._rotation_frames = asset_manager.get_rotation_frames("player")
 
     def triangle(self):
-        """Get triangle points for drawing."""
-        forward = pygame.Vector2(0, -1).rotate(self.rotation)
-        right = pygame.Vector2(0, -1).rotate(self.rotation + 90) * self.radius / 1.5
-        a = self.position + forward * self.radius
-        b = self.position - forward * self.radius - right
-        c = self.position - forward * self.radius + right
-        return [a, b, c]
-
-    def draw(self, screen):
-        """Draw the player ship."""
+        """Get triangle points for drawing, as (x, y) tuples."""
+        # Plain float math; Vector2 arithmetic here would allocate a temporary per operation
+        x, y = self.position
+        fx, fy = self.forward
+        fx *= self.radius
+        fy *= self.radius
+        rx = -fy / 1.5  # Right is forward turned 90 degrees
+        ry = fx / 1.5
+        return [(x + fx, y + fy), (x - fx - rx, y - fy - ry), (x - fx + rx, y - fy + ry)]
+
+    def is_visible(self):
+        """Check if the ship should be drawn this frame."""
         # Flash during invulnerability
         if self.invulnerable_timer > 0 and int(self.invulnerable_timer * 10) % 2:
-            return  # Skip drawing to create flashing effect
+            return False
+        return not self.is_respawning
+
+    def blit_tuple(self):
+        """Get the (surface, rect) pair used to draw the ship."""
+        frames = self._rotation_frames
+        if frames and self.is_visible():
+            # Snap to the nearest pre-rendered angle; sprites rotate counter-clockwise
+            steps = len(frames)
+            rotated_image = frames[round(-self.rotation * steps / 360) % steps]
+            return rotated_image, rotated_image.get_rect(center=self.position)
+        return None
+
+    def draw(self, screen):
+        """Draw the player ship and return the screen area it covered."""
+        if not self.is_visible():
+            return None  # Skip drawing to create flashing effect
+        
+        blit = self.blit_tuple()
+        if blit:
+            return screen.blit(*blit)
         
-        if not self.is_respawning:
-            if self._sprite_image:
-                # Use sprite image if available
-                try:
-                    from ..assets import get_asset_manager
-                    asset_manager = get_asset_manager()
-                    rotated_image = asset_manager.get_rotated_image("player", -self.rotation)
-                    if rotated_image:
-                        rect = rotated_image.get_rect(center=self.position)
-                        screen.blit(rotated_image, rect)
-                        return
-                except ImportError:
-                    pass
-            
-            # Fallback to drawing triangle
-            pygame.draw.polygon(screen, "white", self.triangle(), 2)
+        # Fallback to drawing triangle
+        return pygame.draw.polygon(screen, "white", self.triangle(), 2)
 
     def rotate(self, dt):
         """Rotate the player ship."""
         self.rotation += dt * PLAYER_TURN_SPEED
+        # Same as Vector2(0, -1).rotate(rotation), but updated in place
+        self.forward.from_polar((1, self.rotation - 90))
 
     def move(self, dt):
         """Apply thrust to the player ship."""
-        forward = pygame.Vector2(0, -1).rotate(self.rotation)
-        self.velocity += forward * PLAYER_SPEED * dt
+        self.velocity += self.forward * (PLAYER_SPEED * dt)
+
+    def apply_input(self, thrust, turn, dt):
+        """
+        Apply one frame of held movement input.
+        
+        Args:
+            thrust: 1 for forward, -1 for backward, 0 for none
+            turn: 1 for right, -1 for left, 0 for none
+            dt: Frame time in seconds
+        """
+        if turn:
+            self.rotate(turn * dt)
+        if thrust:
+            self.move(thrust * dt)
 
     def update(self, dt):
         """Update player state."""
@@ -108,11 +135,11 @@ class Player(CircleShape):
             return None
 
         # Get the direction vector
-        forward = pygame.Vector2(0, -1).rotate(self.rotation)
+        forward = self.forward
         
         # Spawn the shot at the tip of the triangle
         spawn_pos = self.position + forward * self.radius
-        shot = Shot(spawn_pos.x, spawn_pos.y)
+        shot = Shot.spawn(spawn_pos.x, spawn_pos.y)
         
         # Set velocity in the forward direction
         shot.velocity = forward * PLAYER_SHOOT_SPEED
@@ -144,4 +171,5 @@ class Player(CircleShape):
         """Complete the respawn process."""
         self.is_respawning = False
         self.invulnerable_timer = 2.0  # 2 seconds of invulnerability
-        self.rotation = 0 
\ No newline at end of file
+        self.rotation = 0
+        self.forward.update(0, -1)
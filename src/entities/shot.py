@@ -1,11 +1,20 @@
 import pygame
-from .circleshape import CircleShape
+from .circleshape import CircleShape, get_asset_manager
 from ..config.constants import *
 
 class Shot(CircleShape):
+    # Killed shots waiting to be reused by spawn()
+    _pool = []
+    _pool_size = SHOT_POOL_SIZE
+    
+    # Every shot uses the same sprite, so it is looked up once for the class
+    # (and again only after the asset manager reloads its assets)
+    _shared_sprite = None
+    _sprite_generation = None
+    
     def __init__(self, x, y):
         super().__init__(x, y, SHOT_RADIUS)
-        self.lifetime = 3.0  # Remove shots after 3 seconds
+        self.lifetime = SHOT_LIFETIME  # Remove shots after 3 seconds
         # Don't initialize velocity here - it will be set by the player
         
         # Asset management
@@ -14,12 +23,19 @@ class Shot(CircleShape):
 
     def _load_sprite(self):
         """Load the shot sprite from asset manager."""
-        try:
-            from ..assets import get_asset_manager
+        if get_asset_manager is not None:
             asset_manager = get_asset_manager()
-            self._sprite_image = asset_manager.get_image("shot")
-        except ImportError:
-            self._sprite_image = None
+            if Shot._sprite_generation != asset_manager.generation:
+                Shot._shared_sprite = asset_manager.get_image("shot")
+                Shot._sprite_generation = asset_manager.generation
+        self._sprite_image = Shot._shared_sprite
+
+    def reset(self, x, y):
+        """Reinitialize a pooled shot and put it back in its containers."""
+        self.lifetime = SHOT_LIFETIME
+        # Pick up the new sprite if assets were reloaded while this shot was pooled
+        self._load_sprite()
+        super().reset(x, y)
 
     def update(self, dt):
         # Move in a straight line at constant speed
@@ -33,11 +49,17 @@ class Shot(CircleShape):
         if self.lifetime <= 0:
             self.kill()
 
-    def draw(self, screen):
+    def blit_tuple(self):
+        """Get the (surface, rect) pair used to draw this shot."""
         if self._sprite_image:
+            return self._sprite_image, self._sprite_image.get_rect(center=self.position)
+        return None
+
+    def draw(self, screen):
+        blit = self.blit_tuple()
+        if blit:
             # Use sprite image if available
-            rect = self._sprite_image.get_rect(center=self.position)
-            screen.blit(self._sprite_image, rect)
+            return screen.blit(*blit)
         else:
             # Fallback to drawing circle
-            pygame.draw.circle(screen, "white", self.position, self.radius, 2) 
\ No newline at end of file
+            return pygame.draw.circle(screen, "white", self.position, self.radius, 2) 
\ No newline at end of file
@@ -3,9 +3,42 @@ Collision detection system for the Asteroids game.
 Handles all collision logic between game entities.
 """
 
+import math
 import pygame
 from typing import List, Tuple, Optional
 from ..entities.base_entity import BaseEntity
+from ..config.constants import COLLISION_CELL_SIZE, SPATIAL_HASH_THRESHOLD
+from ..utils.spatial_hash import SpatialHash
+
+
+def _collide_pairs(xs1: List[float], ys1: List[float], radii1: List[float],
+                   xs2: List[float], ys2: List[float], radii2: List[float]) -> List[Tuple[int, int]]:
+    """
+    Narrow-phase kernel over two sets of circles stored as parallel arrays.
+    
+    Bounding boxes of the second set are pre-filtered in C with
+    Rect.collidelistall, so only overlapping boxes reach the exact
+    squared-distance test.
+    
+    Returns:
+        List of (i, j) index pairs whose circles overlap
+    """
+    # Boxes are padded by a pixel since Rect truncates float coordinates
+    Rect = pygame.Rect
+    boxes2 = [Rect(x - r - 1, y - r - 1, 2 * r + 2, 2 * r + 2)
+              for x, y, r in zip(xs2, ys2, radii2)]
+    
+    pairs = []
+    append = pairs.append
+    for i, (x1, y1, r1) in enumerate(zip(xs1, ys1, radii1)):
+        box = Rect(x1 - r1 - 1, y1 - r1 - 1, 2 * r1 + 2, 2 * r1 + 2)
+        for j in box.collidelistall(boxes2):
+            dx = x1 - xs2[j]
+            dy = y1 - ys2[j]
+            reach = r1 + radii2[j]
+            if dx * dx + dy * dy <= reach * reach:
+                append((i, j))
+    return pairs
 
 
 class CollisionSystem:
@@ -13,6 +46,9 @@ class CollisionSystem:
     
     def __init__(self):
         self.collision_pairs = []
+        
+        # Broad phase for large groups, rebuilt on every check that uses it
+        self.spatial_hash = SpatialHash(COLLISION_CELL_SIZE)
     
     def check_collision(self, entity1: BaseEntity, entity2: BaseEntity) -> bool:
         """
@@ -25,19 +61,44 @@ class CollisionSystem:
         Returns:
             True if entities are colliding, False otherwise
         """
-        if not hasattr(entity1, 'position') or not hasattr(entity2, 'position'):
-            return False
-        if not hasattr(entity1, 'radius') or not hasattr(entity2, 'radius'):
-            return False
+        # Compare squared distances so no sqrt is needed
+        p1 = entity1.position
+        p2 = entity2.position
+        dx = p1.x - p2.x
+        dy = p1.y - p2.y
+        reach = entity1.radius + entity2.radius
+        return dx * dx + dy * dy <= reach * reach
+    
+    def _gather_soa(self, group) -> Tuple[List, List[float], List[float], List[float]]:
+        """
+        Read positions and radii of a group into parallel arrays.
+        
+        Args:
+            group: Group (or any iterable) of entities
             
-        distance = entity1.position.distance_to(entity2.position)
-        return distance <= (entity1.radius + entity2.radius)
+        Returns:
+            Tuple of (entities, xs, ys, radii)
+        """
+        entities = []
+        xs = []
+        ys = []
+        radii = []
+        for entity in group:
+            position = entity.position
+            entities.append(entity)
+            xs.append(position.x)
+            ys.append(position.y)
+            radii.append(entity.radius)
+        return entities, xs, ys, radii
     
     def check_collisions_between_groups(self, group1: pygame.sprite.Group, 
                                       group2: pygame.sprite.Group) -> List[Tuple]:
         """
         Check collisions between all entities in two groups.
         
+        Entity attributes are read once per call into flat arrays so the
+        pairwise loop only does float arithmetic on squared distances.
+        
         Args:
             group1: First group of entities
             group2: Second group of entities
@@ -45,11 +106,54 @@ class CollisionSystem:
         Returns:
             List of collision pairs (entity1, entity2)
         """
+        entities1, xs1, ys1, radii1 = self._gather_soa(group1)
+        entities2, xs2, ys2, radii2 = self._gather_soa(group2)
+        
+        if len(entities2) > SPATIAL_HASH_THRESHOLD:
+            return self._check_collisions_hashed(entities1, entities2)
+        
+        collisions = []
+        for i, j in _collide_pairs(xs1, ys1, radii1, xs2, ys2, radii2):
+            entity1 = entities1[i]
+            entity2 = entities2[j]
+            if entity1 is not entity2:
+                collisions.append((entity1, entity2))
+        return collisions
+    
+    def _check_collisions_hashed(self, entities1: List, entities2: List) -> List[Tuple]:
+        """
+        Check collisions through the spatial hash, so each entity of the first
+        list is only tested against entities of the second that share a cell.
+        
+        Pairs come out in the same order as the brute force path.
+        """
+        grid = self.spatial_hash
+        grid.build(entities2)
+        
+        # Candidates are listed in insertion order per query, not in group order
+        order = {id(entity): j for j, entity in enumerate(entities2)}
+        
         collisions = []
-        for entity1 in group1:
-            for entity2 in group2:
-                if entity1 != entity2 and self.check_collision(entity1, entity2):
-                    collisions.append((entity1, entity2))
+        for entity1 in entities1:
+            position = entity1.position
+            x1 = position.x
+            y1 = position.y
+            r1 = entity1.radius
+            hits = []
+            for entity2 in grid.query(entity1):
+                if entity2 is entity1:
+                    continue
+                other = entity2.position
+                dx = x1 - other.x
+                dy = y1 - other.y
+                reach = r1 + entity2.radius
+                if dx * dx + dy * dy <= reach * reach:
+                    hits.append(entity2)
+            if len(hits) > 1:
+                hits.sort(key=lambda entity: order[id(entity)])
+            for entity2 in hits:
+                collisions.append((entity1, entity2))
+        grid.clear()
         return collisions
     
     def check_collisions_within_group(self, group: pygame.sprite.Group) -> List[Tuple]:
@@ -62,13 +166,20 @@ class CollisionSystem:
         Returns:
             List of collision pairs (entity1, entity2)
         """
-        collisions = []
-        entities = list(group)
-        for i, entity1 in enumerate(entities):
-            for entity2 in entities[i+1:]:
-                if self.check_collision(entity1, entity2):
-                    collisions.append((entity1, entity2))
-        return collisions
+        entities, xs, ys, radii = self._gather_soa(group)
+        
+        if len(entities) <= SPATIAL_HASH_THRESHOLD:
+            collisions = []
+            for i, j in _collide_pairs(xs, ys, radii, xs, ys, radii):
+                if i < j:
+                    collisions.append((entities[i], entities[j]))
+            return collisions
+        
+        # Each pair is found from both sides; keep it only from the earlier entity
+        hashed = self._check_collisions_hashed(entities, entities)
+        order = {id(entity): i for i, entity in enumerate(entities)}
+        return [(entity1, entity2) for entity1, entity2 in hashed
+                if order[id(entity1)] < order[id(entity2)]]
     
     def resolve_collision(self, entity1: BaseEntity, entity2: BaseEntity) -> dict:
         """
@@ -81,16 +192,18 @@ class CollisionSystem:
         Returns:
             Dictionary with collision information
         """
+        delta = entity2.position - entity1.position
+        distance = delta.length()
         collision_info = {
             'entity1': entity1,
             'entity2': entity2,
             'collision_point': (entity1.position + entity2.position) / 2,
-            'distance': entity1.position.distance_to(entity2.position)
+            'distance': distance
         }
         
-        # Calculate collision normal
-        if collision_info['distance'] > 0:
-            collision_info['normal'] = (entity2.position - entity1.position).normalize()
+        # Calculate collision normal, reusing the distance instead of normalizing
+        if distance > 0:
+            collision_info['normal'] = delta / distance
         else:
             collision_info['normal'] = pygame.Vector2(1, 0)
             
@@ -104,13 +217,19 @@ class CollisionSystem:
             entity1: First entity to separate
             entity2: Second entity to separate
         """
-        distance = entity1.position.distance_to(entity2.position)
+        p1 = entity1.position
+        p2 = entity2.position
+        dx = p2.x - p1.x
+        dy = p2.y - p1.y
+        distance_sq = dx * dx + dy * dy
         min_distance = entity1.radius + entity2.radius
         
-        if distance < min_distance:
-            if distance > 0:
+        # Only overlapping entities need the actual distance
+        if distance_sq < min_distance * min_distance:
+            if distance_sq > 0:
                 # Calculate separation vector
-                separation = (entity2.position - entity1.position).normalize()
+                distance = math.sqrt(distance_sq)
+                separation = pygame.Vector2(dx / distance, dy / distance)
                 overlap = min_distance - distance
                 
                 # Move entities apart
@@ -123,4 +242,4 @@ class CollisionSystem:
                 
                 # Move entities apart
                 entity1.position -= separation * (overlap / 2)
-                entity2.position += separation * (overlap / 2) 
\ No newline at end of file
+                entity2.position += separation * (overlap / 2)
@@ -3,11 +3,16 @@ Game state management system for the Asteroids game.
 Handles game logic, scoring, lives, and game flow.
 """
 
+import heapq
 import pygame
 from enum import Enum
 from typing import List, Dict, Any
+from ..assets import get_asset_manager
 from ..entities.explosion import Explosion
 
+# Number of high scores kept and saved
+MAX_HIGH_SCORES = 10
+
 
 class GamePhase(Enum):
     """Different phases of the game."""
@@ -23,12 +28,17 @@ class GameState:
     
     def __init__(self):
         self.reset_game()
-        self.font = pygame.font.Font(None, 36)
-        self.large_font = pygame.font.Font(None, 72)
+        # UI text is rendered through the asset manager's shared text cache
+        self.asset_manager = get_asset_manager()
+        self.dim_overlay = None
         self.explosions = []
         self.phase = GamePhase.PLAYING
         self.high_scores = self.load_high_scores()
         
+        # Min-heap of the same scores, so the lowest one is always at index 0
+        self.high_score_heap = list(self.high_scores)
+        heapq.heapify(self.high_score_heap)
+        
         # Game statistics
         self.stats = {
             'shots_fired': 0,
@@ -124,19 +134,20 @@ class GameState:
     
     def is_high_score(self, score: int) -> bool:
         """Check if the given score is a high score."""
-        # If we have fewer than 10 scores, only consider it a high score if it's better than existing scores
-        if len(self.high_scores) < 10:
-            if len(self.high_scores) == 0:
-                return True  # First score is always a high score
-            return score > min(self.high_scores)
-        return score > min(self.high_scores)
+        heap = self.high_score_heap
+        if not heap:
+            return True  # First score is always a high score
+        # Even with fewer than MAX_HIGH_SCORES, only scores that beat the lowest count
+        return score > heap[0]
     
     def add_high_score(self, score: int, name: str = "PLAYER"):
         """Add a new high score."""
-        self.high_scores.append(score)
-        self.high_scores.sort(reverse=True)
-        if len(self.high_scores) > 10:
-            self.high_scores = self.high_scores[:10]
+        heap = self.high_score_heap
+        if len(heap) < MAX_HIGH_SCORES:
+            heapq.heappush(heap, score)
+        elif heapq.heappushpop(heap, score) == score:
+            return  # Dropped straight back out; the table and file are unchanged
+        self.high_scores = sorted(heap, reverse=True)
         self.save_high_scores()
     
     def load_high_scores(self) -> List[int]:
@@ -144,7 +155,7 @@ class GameState:
         try:
             with open('high_scores.txt', 'r') as f:
                 scores = [int(line.strip()) for line in f.readlines()]
-                return sorted(scores, reverse=True)[:10]
+                return sorted(scores, reverse=True)[:MAX_HIGH_SCORES]
         except (FileNotFoundError, ValueError):
             return [1000, 800, 600, 400, 200]  # Default high scores
     
@@ -152,80 +163,105 @@ class GameState:
         """Save high scores to file."""
         try:
             with open('high_scores.txt', 'w') as f:
-                for score in self.high_scores:
-                    f.write(f"{score}\n")
+                f.write("".join(f"{score}\n" for score in self.high_scores))
         except IOError:
             pass  # Fail silently if we can't save
     
     def add_explosion(self, x: float, y: float, size: str = "normal"):
         """Add an explosion effect."""
-        self.explosions.append(Explosion(x, y, size))
+        self.explosions.append(Explosion.spawn(x, y, size))
     
     def update_explosions(self, dt: float):
         """Update all explosion effects."""
-        for explosion in self.explosions[:]:
+        # Compact survivors to the front in place instead of copying and removing
+        explosions = self.explosions
+        alive = 0
+        for explosion in explosions:
             explosion.update(dt)
             if explosion.is_finished():
-                self.explosions.remove(explosion)
+                explosion.recycle()
+            else:
+                explosions[alive] = explosion
+                alive += 1
+        del explosions[alive:]
     
-    def draw_explosions(self, screen: pygame.Surface):
-        """Draw all explosion effects."""
+    def draw_explosions(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Draw all explosion effects and return the screen areas they covered."""
+        dirty_rects = []
         for explosion in self.explosions:
-            explosion.draw(screen)
+            rect = explosion.draw(screen)
+            if rect:
+                dirty_rects.append(rect)
+        return dirty_rects
     
-    def draw_ui(self, screen: pygame.Surface, player):
-        """Draw the game UI."""
+    def render_text(self, text: str, font_name: str, color) -> pygame.Surface:
+        """Render a line of UI text, reusing the surface while the text is unchanged."""
+        return self.asset_manager.create_text_surface(text, font_name, color)
+    
+    def draw_ui(self, screen: pygame.Surface, player) -> List[pygame.Rect]:
+        """Draw the game UI and return the screen areas it covered."""
+        dirty_rects = []
+        
         # Draw score
-        score_text = self.font.render(f"Score: {self.score:,}", True, "white")
-        screen.blit(score_text, (10, 10))
+        score_text = self.render_text(f"Score: {self.score:,}", "medium", "white")
+        dirty_rects.append(screen.blit(score_text, (10, 10)))
         
         # Draw level
-        level_text = self.font.render(f"Level: {self.level}", True, "white")
-        screen.blit(level_text, (10, 50))
+        level_text = self.render_text(f"Level: {self.level}", "medium", "white")
+        dirty_rects.append(screen.blit(level_text, (10, 50)))
         
         # Draw lives
         if player:
-            lives_text = self.font.render(f"Lives: {player.lives}", True, "white")
-            screen.blit(lives_text, (10, 90))
+            lives_text = self.render_text(f"Lives: {player.lives}", "medium", "white")
+            dirty_rects.append(screen.blit(lives_text, (10, 90)))
         
         # Draw bonus multiplier if active
         if self.bonus_multiplier > 1.0:
-            multiplier_text = self.font.render(f"Bonus: x{self.bonus_multiplier:.1f}", True, "yellow")
-            screen.blit(multiplier_text, (10, 130))
+            multiplier_text = self.render_text(f"Bonus: x{self.bonus_multiplier:.1f}", "medium", "yellow")
+            dirty_rects.append(screen.blit(multiplier_text, (10, 130)))
         
         # Draw pause indicator
         if self.paused:
-            pause_text = self.large_font.render("PAUSED", True, "yellow")
+            pause_text = self.render_text("PAUSED", "huge", "yellow")
             pause_rect = pause_text.get_rect(center=(screen.get_width()//2, screen.get_height()//2))
-            screen.blit(pause_text, pause_rect)
+            dirty_rects.append(screen.blit(pause_text, pause_rect))
         
         # Draw wave complete message
         if self.wave_complete:
-            wave_text = self.font.render(f"Wave {self.level-1} Complete! Next wave in {3.0-self.wave_timer:.1f}s", True, "green")
+            wave_text = self.render_text(f"Wave {self.level-1} Complete! Next wave in {3.0-self.wave_timer:.1f}s", "medium", "green")
             wave_rect = wave_text.get_rect(center=(screen.get_width()//2, 100))
-            screen.blit(wave_text, wave_rect)
+            dirty_rects.append(screen.blit(wave_text, wave_rect))
         
         # Draw game over screen
         if self.phase == GamePhase.GAME_OVER:
-            self.draw_game_over_screen(screen)
+            dirty_rects.extend(self.draw_game_over_screen(screen))
         elif self.phase == GamePhase.HIGH_SCORE:
-            self.draw_high_score_screen(screen)
+            dirty_rects.extend(self.draw_high_score_screen(screen))
+        
+        return dirty_rects
+    
+    def get_dim_overlay(self, screen: pygame.Surface) -> pygame.Surface:
+        """Get the semi-transparent black overlay for the screen, building it once per size."""
+        overlay = self.dim_overlay
+        if overlay is None or overlay.get_size() != screen.get_size():
+            overlay = pygame.Surface(screen.get_size()).convert(screen)
+            overlay.fill((0, 0, 0))
+            overlay.set_alpha(128)
+            self.dim_overlay = overlay
+        return overlay
     
-    def draw_game_over_screen(self, screen: pygame.Surface):
+    def draw_game_over_screen(self, screen: pygame.Surface) -> List[pygame.Rect]:
         """Draw the game over screen."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        overlay_rect = screen.blit(self.get_dim_overlay(screen), (0, 0))
         
         # Game over text
-        game_over_text = self.large_font.render("GAME OVER", True, "red")
+        game_over_text = self.render_text("GAME OVER", "huge", "red")
         game_over_rect = game_over_text.get_rect(center=(screen.get_width()//2, screen.get_height()//2 - 100))
         screen.blit(game_over_text, game_over_rect)
         
         # Final score
-        final_score_text = self.font.render(f"Final Score: {self.score:,}", True, "white")
+        final_score_text = self.render_text(f"Final Score: {self.score:,}", "medium", "white")
         score_rect = final_score_text.get_rect(center=(screen.get_width()//2, screen.get_height()//2 - 50))
         screen.blit(final_score_text, score_rect)
         
@@ -240,34 +276,37 @@ class GameState:
         ]
         
         for i, stat_text in enumerate(stats_texts):
-            text = self.font.render(stat_text, True, "white")
+            text = self.render_text(stat_text, "medium", "white")
             text_rect = text.get_rect(center=(screen.get_width()//2, stats_y + i * 30))
             screen.blit(text, text_rect)
         
         # Restart instruction
-        restart_text = self.font.render("Press R to restart or ESC to quit", True, "yellow")
+        restart_text = self.render_text("Press R to restart or ESC to quit", "medium", "yellow")
         restart_rect = restart_text.get_rect(center=(screen.get_width()//2, screen.get_height()//2 + 200))
         screen.blit(restart_text, restart_rect)
+        
+        # The overlay covers the whole screen, so it is the only dirty rect
+        return [overlay_rect]
     
-    def draw_high_score_screen(self, screen: pygame.Surface):
+    def draw_high_score_screen(self, screen: pygame.Surface) -> List[pygame.Rect]:
         """Draw the high score entry screen."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        overlay_rect = screen.blit(self.get_dim_overlay(screen), (0, 0))
         
         # High score text
-        high_score_text = self.large_font.render("NEW HIGH SCORE!", True, "gold")
+        high_score_text = self.render_text("NEW HIGH SCORE!", "huge", "gold")
         high_score_rect = high_score_text.get_rect(center=(screen.get_width()//2, screen.get_height()//2 - 100))
         screen.blit(high_score_text, high_score_rect)
         
         # Score
-        score_text = self.font.render(f"Score: {self.score:,}", True, "white")
+        score_text = self.render_text(f"Score: {self.score:,}", "medium", "white")
         score_rect = score_text.get_rect(center=(screen.get_width()//2, screen.get_height()//2 - 50))
         screen.blit(score_text, score_rect)
         
         # Instructions
-        instruction_text = self.font.render("Press R to continue", True, "white")
+        instruction_text = self.render_text("Press R to continue", "medium", "white")
         instruction_rect = instruction_text.get_rect(center=(screen.get_width()//2, screen.get_height()//2 + 50))
-        screen.blit(instruction_text, instruction_rect) 
\ No newline at end of file
+        screen.blit(instruction_text, instruction_rect)
+        
+        # The overlay covers the whole screen, so it is the only dirty rect
+        return [overlay_rect]
@@ -3,7 +3,9 @@ Input system for the Asteroids game.
 Handles all keyboard and mouse input processing.
 """
 
+import inspect
 import pygame
+from collections import deque
 from typing import Dict, Set, Callable, Optional
 from enum import Enum
 
@@ -22,6 +24,21 @@ class InputAction(Enum):
     SHIELD = "shield"
 
 
+# Bit assigned to each action in InputSystem.held_mask
+ACTION_BITS: Dict[InputAction, int] = {action: 1 << index for index, action in enumerate(InputAction)}
+
+
+def _accepts_argument(callback: Callable) -> bool:
+    """Check whether a callback can be called with one positional argument."""
+    try:
+        inspect.signature(callback).bind(None)
+    except TypeError:
+        return False
+    except ValueError:
+        return True  # No signature available (some builtins); assume it does
+    return True
+
+
 class InputSystem:
     """Handles input processing and key mapping."""
     
@@ -52,8 +69,14 @@ class InputSystem:
         # Combine mappings
         self.key_mappings.update(self.alternative_mappings)
         
+        # Reverse lookup of the primary (first mapped) key for each action
+        self.action_keys: Dict[InputAction, int] = {}
+        self._rebuild_action_keys()
+        
         # Action callbacks
         self.action_callbacks: Dict[InputAction, Callable] = {}
+        self.callback_takes_dt: Dict[InputAction, bool] = {}
+        self.callback_mask = 0  # ACTION_BITS of the actions with a callback
         self.continuous_actions: Set[InputAction] = {
             InputAction.THRUST_FORWARD,
             InputAction.THRUST_BACKWARD,
@@ -73,29 +96,41 @@ class InputSystem:
         self.just_activated: Set[InputAction] = set()
         self.just_deactivated: Set[InputAction] = set()
         
-        # Input history for debugging
-        self.input_history = []
+        # Bitmask of held continuous actions, one bit per ACTION_BITS entry
+        self.held_mask = 0
+        
+        # Input history for debugging; the game only records it in debug mode
+        self.record_history = True
         self.max_history = 100
+        self.input_history = deque(maxlen=self.max_history)  # Drops the oldest entry when full
     
     def register_callback(self, action: InputAction, callback: Callable):
         """Register a callback function for an input action."""
         self.action_callbacks[action] = callback
+        self.callback_takes_dt[action] = _accepts_argument(callback)
+        self.callback_mask |= ACTION_BITS[action]
     
     def unregister_callback(self, action: InputAction):
         """Unregister a callback function for an input action."""
         if action in self.action_callbacks:
             del self.action_callbacks[action]
+            del self.callback_takes_dt[action]
+            self.callback_mask &= ~ACTION_BITS[action]
     
     def remap_key(self, key: int, action: InputAction):
         """Remap a key to a different action."""
         self.key_mappings[key] = action
+        self._rebuild_action_keys()
+    
+    def _rebuild_action_keys(self):
+        """Recompute action_keys from key_mappings after a mapping change."""
+        self.action_keys.clear()
+        for key, action in self.key_mappings.items():
+            self.action_keys.setdefault(action, key)
     
     def get_key_for_action(self, action: InputAction) -> Optional[int]:
         """Get the primary key mapped to an action."""
-        for key, mapped_action in self.key_mappings.items():
-            if mapped_action == action:
-                return key
-        return None
+        return self.action_keys.get(action)
     
     def handle_event(self, event: pygame.event.Event):
         """Process a pygame event."""
@@ -104,9 +139,8 @@ class InputSystem:
             self.pressed_keys.add(event.key)
             
             # Track input history
-            self.input_history.append(f"KEY_DOWN: {pygame.key.name(event.key)}")
-            if len(self.input_history) > self.max_history:
-                self.input_history.pop(0)
+            if self.record_history:
+                self.input_history.append(f"KEY_DOWN: {pygame.key.name(event.key)}")
             
             # Handle single-press actions
             if event.key in self.key_mappings:
@@ -116,6 +150,7 @@ class InputSystem:
                 else:
                     self.active_actions.add(action)
                     self.just_activated.add(action)
+                    self.held_mask |= ACTION_BITS[action]
         
         elif event.type == pygame.KEYUP:
             if event.key in self.pressed_keys:
@@ -128,12 +163,15 @@ class InputSystem:
                 if action in self.active_actions:
                     self.active_actions.remove(action)
                     self.just_deactivated.add(action)
+                    self.held_mask &= ~ACTION_BITS[action]
     
     def update(self, dt: float):
         """Update input system state."""
-        # Process continuous actions
-        for action in self.active_actions:
-            self.trigger_action(action, continuous=True, dt=dt)
+        # Process continuous actions, skipping the walk when none of the held ones
+        # has a callback (the game polls held_mask instead)
+        if self.held_mask & self.callback_mask:
+            for action in self.active_actions:
+                self.trigger_action(action, continuous=True, dt=dt)
         
         # Clear frame-specific state
         self.just_pressed.clear()
@@ -143,17 +181,15 @@ class InputSystem:
     
     def trigger_action(self, action: InputAction, continuous: bool = False, dt: float = 0.0):
         """Trigger an action callback if registered."""
-        if action in self.action_callbacks:
-            callback = self.action_callbacks[action]
-            if continuous:
-                # Pass dt for continuous actions
-                try:
-                    callback(dt)
-                except TypeError:
-                    # Fallback for callbacks that don't accept dt
-                    callback()
-            else:
-                callback()
+        callback = self.action_callbacks.get(action)
+        if callback is None:
+            return
+        
+        # Pass dt for continuous actions, if the callback was registered accepting it
+        if continuous and self.callback_takes_dt[action]:
+            callback(dt)
+        else:
+            callback()
     
     def is_action_active(self, action: InputAction) -> bool:
         """Check if an action is currently active."""
@@ -187,7 +223,7 @@ class InputSystem:
     
     def get_input_history(self) -> list:
         """Get the input history for debugging."""
-        return self.input_history.copy()
+        return list(self.input_history)
     
     def clear_input_history(self):
         """Clear the input history."""
@@ -201,4 +237,5 @@ class InputSystem:
         self.active_actions.clear()
         self.just_activated.clear()
         self.just_deactivated.clear()
+        self.held_mask = 0
         self.clear_input_history() 
\ No newline at end of file
@@ -5,10 +5,12 @@ Mathematical utility functions for the game.
 import math
 import random
 import pygame
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
-def wrap_position(position: pygame.Vector2, screen_width: int, screen_height: int, radius: float) -> pygame.Vector2:
+def wrap_position(position: pygame.Vector2, screen_width: int, screen_height: int, radius: float,
+                  out: Optional[pygame.Vector2] = None) -> pygame.Vector2:
     """
     Wrap a position around screen boundaries.
     
@@ -17,6 +19,8 @@ def wrap_position(position: pygame.Vector2, screen_width: int, screen_height: in
         screen_width: Screen width
         screen_height: Screen height
         radius: Object radius for proper wrapping
+        out: Vector to write the result into instead of allocating a new one
+             (may be position itself)
         
     Returns:
         Wrapped position
@@ -32,8 +36,18 @@ def wrap_position(position: pygame.Vector2, screen_width: int, screen_height: in
         y = screen_height + radius
     elif y > screen_height + radius:
         y = -radius
-        
-    return pygame.Vector2(x, y)
+    
+    if out is None:
+        return pygame.Vector2(x, y)
+    out.update(x, y)
+    return out
+
+
+def distance_squared(pos1: pygame.Vector2, pos2: pygame.Vector2) -> float:
+    """Calculate squared distance between two positions, for comparisons that need no sqrt."""
+    dx = pos1.x - pos2.x
+    dy = pos1.y - pos2.y
+    return dx * dx + dy * dy
 
 
 def distance_between(pos1: pygame.Vector2, pos2: pygame.Vector2) -> float:
@@ -46,10 +60,13 @@ def normalize_angle(angle: float) -> float:
     return angle % 360
 
 
-def angle_to_vector(angle: float) -> pygame.Vector2:
-    """Convert angle in degrees to unit vector."""
+def angle_to_vector(angle: float, out: Optional[pygame.Vector2] = None) -> pygame.Vector2:
+    """Convert angle in degrees to unit vector, written into out if given."""
     rad = math.radians(angle)
-    return pygame.Vector2(math.cos(rad), math.sin(rad))
+    if out is None:
+        return pygame.Vector2(math.cos(rad), math.sin(rad))
+    out.update(math.cos(rad), math.sin(rad))
+    return out
 
 
 def vector_to_angle(vector: pygame.Vector2) -> float:
@@ -57,6 +74,15 @@ def vector_to_angle(vector: pygame.Vector2) -> float:
     return math.degrees(math.atan2(vector.y, vector.x))
 
 
+@lru_cache(maxsize=None)
+def unit_circle_points(num_points: int) -> Tuple[Tuple[float, float], ...]:
+    """Get (cos, sin) pairs for num_points evenly spaced angles, computed once per count."""
+    return tuple(
+        (math.cos(2 * math.pi * i / num_points), math.sin(2 * math.pi * i / num_points))
+        for i in range(num_points)
+    )
+
+
 def generate_lumpy_asteroid_points(center: pygame.Vector2, base_radius: float, vertices: int) -> List[pygame.Vector2]:
     """
     Generate points for a lumpy asteroid shape.
@@ -70,18 +96,15 @@ def generate_lumpy_asteroid_points(center: pygame.Vector2, base_radius: float, v
         List of points forming the asteroid shape
     """
     points = []
-    angle_step = 360 / vertices
+    cx, cy = center.x, center.y
     
-    for i in range(vertices):
-        angle = i * angle_step
+    # The vertex directions only depend on the count, so their sin/cos come from a table
+    for cos_a, sin_a in unit_circle_points(vertices):
         # Add some randomness to make it lumpy
         radius_variation = random.uniform(0.7, 1.3)
         radius = base_radius * radius_variation
         
-        rad = math.radians(angle)
-        x = center.x + radius * math.cos(rad)
-        y = center.y + radius * math.sin(rad)
-        points.append(pygame.Vector2(x, y))
+        points.append(pygame.Vector2(cx + radius * cos_a, cy + radius * sin_a))
     
     return points
 
@@ -105,9 +128,22 @@ def random_vector(min_length: float = 0, max_length: float = 1) -> pygame.Vector
 
 def is_point_in_circle(point: pygame.Vector2, center: pygame.Vector2, radius: float) -> bool:
     """Check if a point is inside a circle."""
-    return distance_between(point, center) <= radius
+    return distance_squared(point, center) <= radius * radius
 
 
 def check_collision_circles(pos1: pygame.Vector2, radius1: float, pos2: pygame.Vector2, radius2: float) -> bool:
     """Check collision between two circles."""
-    return distance_between(pos1, pos2) <= radius1 + radius2 
\ No newline at end of file
+    reach = radius1 + radius2
+    return distance_squared(pos1, pos2) <= reach * reach
+
+
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Merge overlapping rects so each screen area is presented only once."""
+    merged = []
+    for rect in rects:
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect = rect.union(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
@@ -0,0 +1,69 @@
+"""
+Uniform-grid spatial hash used as a collision broad phase.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+
+class SpatialHash:
+    """
+    Buckets circular entities into grid cells keyed by (floor(x/cell), floor(y/cell)).
+    Each entity is stored under every cell its bounding box overlaps, so a query
+    only needs to visit the cells covered by the queried entity.
+    """
+    
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List] = defaultdict(list)
+    
+    def clear(self) -> None:
+        """Remove all entities while keeping the bucket dict allocated."""
+        self.cells.clear()
+    
+    def _cell_range(self, x: float, y: float, radius: float) -> Tuple[int, int, int, int]:
+        """Get the inclusive cell bounds covered by a circle's bounding box."""
+        cell = self.cell_size
+        return (int((x - radius) // cell), int((x + radius) // cell),
+                int((y - radius) // cell), int((y + radius) // cell))
+    
+    def insert(self, entity) -> None:
+        """Insert an entity under every cell its bounding box overlaps."""
+        position = entity.position
+        min_cx, max_cx, min_cy, max_cy = self._cell_range(position.x, position.y, entity.radius)
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cells[(cx, cy)].append(entity)
+    
+    def build(self, entities: Iterable) -> None:
+        """Rebuild the hash from scratch for the given entities."""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+    
+    def query(self, entity) -> List:
+        """
+        Get the entities sharing at least one cell with the given entity.
+        
+        Args:
+            entity: Entity with position and radius attributes
+            
+        Returns:
+            Candidate entities, each listed once, in insertion order
+        """
+        position = entity.position
+        min_cx, max_cx, min_cy, max_cy = self._cell_range(position.x, position.y, entity.radius)
+        cells = self.cells
+        candidates = []
+        seen = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for other in bucket:
+                    if id(other) not in seen:
+                        seen.add(id(other))
+                        candidates.append(other)
+        return candidates
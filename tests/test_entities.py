@@ -12,6 +12,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.entities import Player, Asteroid, Shot, Explosion
 from src.config.constants import *
+from src.assets import get_asset_manager
+from src.entities import explosion as explosion_module
 
 
 class TestEntities(unittest.TestCase):
@@ -56,6 +58,16 @@ class TestEntities(unittest.TestCase):
         initial_rotation = self.player.rotation
         self.player.rotate(0.1)  # Rotate for 0.1 seconds
         self.assertNotEqual(self.player.rotation, initial_rotation)
+        
+        # The cached heading follows the rotation
+        expected = pygame.Vector2(0, -1).rotate(self.player.rotation)
+        self.assertAlmostEqual(self.player.forward.x, expected.x)
+        self.assertAlmostEqual(self.player.forward.y, expected.y)
+        
+        # The drawn sprite comes from the pre-rendered rotations
+        image, rect = self.player.blit_tuple()
+        self.assertIn(image, self.player._rotation_frames)
+        self.assertEqual(rect.center, (100, 100))
     
     def test_player_shooting(self):
         """Test player shooting mechanism."""
@@ -122,6 +134,31 @@ class TestEntities(unittest.TestCase):
         self.assertEqual(medium_asteroid.get_score_value(), SCORE_MEDIUM_ASTEROID)
         self.assertEqual(small_asteroid.get_score_value(), SCORE_SMALL_ASTEROID)
     
+    def test_wrap_around_screen(self):
+        """Test entities leaving one edge reappear on the opposite edge."""
+        radius = self.asteroid.radius
+        self.asteroid.position = pygame.Vector2(SCREEN_WIDTH + radius - 1, 100)
+        self.asteroid.velocity = pygame.Vector2(100, 0)
+        self.asteroid.update(0.1)
+        self.assertEqual(self.asteroid.position.x, -radius)
+        self.assertEqual(self.asteroid.position.y, 100)
+    
+    def test_asteroid_split_reuses_killed_asteroid(self):
+        """Test splitting recycles the killed asteroid as one of its fragments."""
+        asteroids = pygame.sprite.Group()
+        Asteroid.containers = (asteroids,)
+        asteroid = Asteroid(200, 200, ASTEROID_MIN_RADIUS * 2)
+        asteroid.velocity = pygame.Vector2(50, 0)
+        
+        asteroid.split()
+        self.assertEqual(len(asteroids), 2)
+        self.assertIn(asteroid, asteroids)
+        for fragment in asteroids:
+            self.assertEqual(fragment.radius, ASTEROID_MIN_RADIUS)
+            self.assertEqual(fragment.get_score_value(), SCORE_SMALL_ASTEROID)
+            self.assertGreater(fragment.velocity.length(), 0)
+        del Asteroid.containers
+    
     def test_shot_creation(self):
         """Test shot creation."""
         self.assertEqual(self.shot.position.x, 150)
@@ -150,6 +187,52 @@ class TestEntities(unittest.TestCase):
         # Shot should be removed after lifetime expires
         self.assertEqual(len(shots), 0)
     
+    def test_shot_reuse(self):
+        """Test killed shots are recycled by Shot.spawn."""
+        shots = pygame.sprite.Group()
+        Shot.containers = (shots,)
+        shot = Shot(150, 150)
+        shot.update(SHOT_LIFETIME + 0.1)
+        self.assertEqual(len(shots), 0)
+        
+        reused = Shot.spawn(10, 20)
+        self.assertIs(reused, shot)
+        self.assertIn(reused, shots)
+        self.assertEqual(reused.position, pygame.Vector2(10, 20))
+        self.assertEqual(reused.lifetime, SHOT_LIFETIME)
+        del Shot.containers
+    
+    def test_shot_sprite_follows_asset_reload(self):
+        """Test shots created after an asset reload use the reloaded sprite."""
+        asset_manager = get_asset_manager()
+        asset_manager.reload_assets()
+        
+        shot = Shot(150, 150)
+        self.assertIs(shot._sprite_image, asset_manager.get_image("shot"))
+        
+        # A pooled shot reused after a reload drops its stale sprite too
+        asset_manager.reload_assets()
+        shot.reset(10, 20)
+        self.assertIs(shot._sprite_image, asset_manager.get_image("shot"))
+    
+    def test_explosion_frames_follow_asset_reload(self):
+        """Test explosion animation frames are rebuilt, not accumulated, on asset reload."""
+        asset_manager = get_asset_manager()
+        old_frames = self.explosion._frames
+        asset_manager.reload_assets()
+        
+        explosion = Explosion(300, 300)
+        self.assertIs(explosion._sprite_image, asset_manager.get_image("explosion"))
+        self.assertIsNot(explosion._frames, old_frames)
+        self.assertEqual(list(explosion_module._animation_frames), [explosion._sprite_image])
+        
+        # A pooled explosion reused after a reload drops its stale frames too
+        old_frames = explosion._frames
+        asset_manager.reload_assets()
+        explosion.reset(10, 20)
+        self.assertIs(explosion._sprite_image, asset_manager.get_image("explosion"))
+        self.assertIsNot(explosion._frames, old_frames)
+    
     def test_explosion_creation(self):
         """Test explosion creation."""
         self.assertGreater(len(self.explosion.particles), 0)
@@ -172,6 +255,26 @@ class TestEntities(unittest.TestCase):
             self.explosion.update(0.1)
         
         self.assertTrue(self.explosion.is_finished())
+    
+    def test_explosion_reuse(self):
+        """Test finished explosions are recycled and restarted by Explosion.spawn."""
+        explosions = pygame.sprite.Group()
+        Explosion.containers = (explosions,)
+        Explosion._pool.clear()
+        explosion = Explosion(300, 300)
+        explosion.update(explosion.max_lifetime + 0.1)
+        self.assertEqual(len(explosions), 0)
+        self.assertEqual(explosion.particles, [])
+        
+        reused = Explosion.spawn(10, 20, "large")
+        self.assertIs(reused, explosion)
+        self.assertIn(reused, explosions)
+        self.assertEqual(reused.position, pygame.Vector2(10, 20))
+        self.assertEqual(reused.lifetime, reused.max_lifetime)
+        self.assertEqual(reused.size, "large")
+        self.assertEqual(len(reused.particles), 20)
+        self.assertFalse(reused.is_finished())
+        del Explosion.containers
 
 
 if __name__ == '__main__':
@@ -11,9 +11,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.systems import GameState, CollisionSystem, InputSystem
-from src.systems.input_system import InputAction
+from src.systems.input_system import InputAction, ACTION_BITS
 from src.entities import Player, Asteroid
 from src.config.constants import *
+from src.utils.spatial_hash import SpatialHash
+from src.utils.math_utils import wrap_position, angle_to_vector, merge_rects
 
 
 class TestGameState(unittest.TestCase):
@@ -90,6 +92,25 @@ class TestGameState(unittest.TestCase):
         self.assertTrue(self.game_state.is_high_score(2000))
         self.assertFalse(self.game_state.is_high_score(100))
     
+    def test_high_score_table_keeps_best_scores(self):
+        """Test adding high scores keeps only the best ones, highest first."""
+        saves = []
+        self.game_state.save_high_scores = lambda: saves.append(True)  # Keep the test off disk
+        for score in range(100, 1700, 100):
+            self.game_state.add_high_score(score)
+        
+        self.assertEqual(len(self.game_state.high_scores), 10)
+        self.assertEqual(self.game_state.high_scores, sorted(self.game_state.high_scores, reverse=True))
+        self.assertEqual(self.game_state.high_scores[0], 1600)
+        self.assertFalse(self.game_state.is_high_score(self.game_state.high_scores[-1]))
+        self.assertTrue(self.game_state.is_high_score(self.game_state.high_scores[-1] + 1))
+        
+        # A score too low for the full table leaves the file alone
+        saves.clear()
+        self.game_state.add_high_score(50)
+        self.assertEqual(saves, [])
+        self.assertNotIn(50, self.game_state.high_scores)
+    
     def test_explosion_management(self):
         """Test explosion effect management."""
         initial_count = len(self.game_state.explosions)
@@ -143,6 +164,34 @@ class TestCollisionSystem(unittest.TestCase):
         self.assertEqual(collisions[0][0], self.player)
         self.assertEqual(collisions[0][1], self.asteroid1)
     
+    def test_spatial_hash_query(self):
+        """Test spatial hash broad phase only returns nearby entities."""
+        grid = SpatialHash(COLLISION_CELL_SIZE)
+        grid.build([self.asteroid1, self.asteroid2])
+        
+        candidates = grid.query(self.player)
+        self.assertIn(self.asteroid1, candidates)
+        self.assertEqual(len(candidates), len(set(candidates)))
+        
+        far_asteroid = Asteroid(1000, 600, ASTEROID_MIN_RADIUS)
+        self.assertNotIn(self.asteroid1, grid.query(far_asteroid))
+    
+    def test_hashed_collisions_match_brute_force(self):
+        """Test the spatial hash path finds the same pairs as pairwise checks."""
+        asteroids = [Asteroid(100 + i % 8 * 30, 100 + i // 8 * 45, ASTEROID_MIN_RADIUS)
+                     for i in range(SPATIAL_HASH_THRESHOLD * 2)]
+        group = pygame.sprite.Group(asteroids)
+        
+        expected = [(a, b) for i, a in enumerate(asteroids) for b in asteroids[i + 1:]
+                    if self.collision_system.check_collision(a, b)]
+        self.assertTrue(expected)
+        self.assertEqual(self.collision_system.check_collisions_within_group(group), expected)
+        
+        shots = pygame.sprite.Group(self.player)
+        expected = [(self.player, a) for a in asteroids
+                    if self.collision_system.check_collision(self.player, a)]
+        self.assertEqual(self.collision_system.check_collisions_between_groups(shots, group), expected)
+    
     def test_collision_resolution(self):
         """Test collision resolution."""
         collision_info = self.collision_system.resolve_collision(self.player, self.asteroid1)
@@ -207,6 +256,18 @@ class TestInputSystem(unittest.TestCase):
         key = self.input_system.get_key_for_action(InputAction.THRUST_FORWARD)
         self.assertIsNotNone(key)
     
+    def test_action_keys_reverse_map(self):
+        """Test the action-to-key reverse map follows remapping."""
+        # The first mapped key is the primary one, and remapping another key keeps it
+        self.assertEqual(self.input_system.action_keys[InputAction.THRUST_FORWARD], pygame.K_w)
+        self.input_system.remap_key(pygame.K_t, InputAction.THRUST_FORWARD)
+        self.assertEqual(self.input_system.get_key_for_action(InputAction.THRUST_FORWARD), pygame.K_w)
+        
+        # Remapping the primary key moves the lookup to the next key for that action
+        self.input_system.remap_key(pygame.K_w, InputAction.SHOOT)
+        self.assertEqual(self.input_system.get_key_for_action(InputAction.THRUST_FORWARD), pygame.K_UP)
+        self.assertEqual(self.input_system.get_key_for_action(InputAction.SHOOT), pygame.K_w)
+    
     def test_key_state_tracking(self):
         """Test key state tracking."""
         # Simulate key press
@@ -247,6 +308,55 @@ class TestInputSystem(unittest.TestCase):
         self.input_system.update(0.1)
         self.assertTrue(self.callback_called)
         self.assertIsNotNone(self.callback_dt)
+        
+        # Continuous callbacks that take no dt are called without it
+        calls = []
+        self.input_system.register_callback(InputAction.THRUST_FORWARD, lambda: calls.append(True))
+        self.input_system.update(0.1)
+        self.assertEqual(calls, [True])
+    
+    def test_update_skips_held_actions_without_callbacks(self):
+        """Test update only dispatches held actions when one of them has a callback."""
+        triggered = []
+        trigger_action = self.input_system.trigger_action
+        def record_trigger(action, continuous=False, dt=0.0):
+            triggered.append(action)
+            trigger_action(action, continuous, dt)
+        self.input_system.trigger_action = record_trigger
+        
+        turns = []
+        self.input_system.register_callback(InputAction.TURN_LEFT, lambda dt: turns.append(dt))
+        self.assertEqual(self.input_system.callback_mask, ACTION_BITS[InputAction.TURN_LEFT])
+        
+        # Held forward thrust has no callback, so the held actions are not walked
+        self.input_system.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w))
+        self.input_system.update(0.1)
+        self.assertEqual(triggered, [])
+        
+        # Once a held action has a callback, it fires and the other still does nothing
+        self.input_system.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        self.input_system.update(0.1)
+        self.assertEqual(turns, [0.1])
+        
+        # With no callbacks left, held actions are skipped again
+        self.input_system.unregister_callback(InputAction.TURN_LEFT)
+        self.assertEqual(self.input_system.callback_mask, 0)
+        triggered.clear()
+        self.input_system.update(0.1)
+        self.assertEqual(triggered, [])
+        self.assertEqual(turns, [0.1])
+    
+    def test_held_action_mask(self):
+        """Test held continuous actions are mirrored in the bitmask."""
+        forward_bit = ACTION_BITS[InputAction.THRUST_FORWARD]
+        
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w)
+        self.input_system.handle_event(event)
+        self.assertTrue(self.input_system.held_mask & forward_bit)
+        
+        event = pygame.event.Event(pygame.KEYUP, key=pygame.K_w)
+        self.input_system.handle_event(event)
+        self.assertEqual(self.input_system.held_mask, 0)
     
     def test_input_history(self):
         """Test input history tracking."""
@@ -259,6 +369,22 @@ class TestInputSystem(unittest.TestCase):
         history = self.input_system.get_input_history()
         self.assertGreater(len(history), initial_history_length)
         self.assertIn("w", history[-1].lower())  # Should contain the key name
+        
+        # With recording off, key presses still register but leave no history
+        self.input_system.clear_input_history()
+        self.input_system.record_history = False
+        self.input_system.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        self.assertTrue(self.input_system.is_key_pressed(pygame.K_a))
+        self.assertEqual(self.input_system.get_input_history(), [])
+        
+        # History keeps only the most recent max_history entries
+        self.input_system.record_history = True
+        for _ in range(self.input_system.max_history):
+            self.input_system.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w))
+        self.input_system.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_d))
+        history = self.input_system.get_input_history()
+        self.assertEqual(len(history), self.input_system.max_history)
+        self.assertIn("d", history[-1].lower())
     
     def test_input_reset(self):
         """Test input system reset."""
@@ -275,5 +401,53 @@ class TestInputSystem(unittest.TestCase):
         self.assertEqual(len(self.input_system.get_input_history()), 0)
 
 
+
+class TestRendering(unittest.TestCase):
+    """Test cases for render helpers."""
+    
+    def test_merge_rects(self):
+        """Test overlapping dirty rects are merged and disjoint ones kept apart."""
+        self.assertEqual(merge_rects([]), [])
+        
+        # Overlapping rects collapse into their union
+        merged = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10)])
+        self.assertEqual(merged, [pygame.Rect(0, 0, 15, 15)])
+        
+        # Disjoint rects are left as they are
+        disjoint = [pygame.Rect(0, 0, 10, 10), pygame.Rect(100, 100, 10, 10)]
+        self.assertEqual(merge_rects(disjoint), disjoint)
+        
+        # A union that reaches an earlier merged rect absorbs it too
+        chained = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 20, 10, 10),
+                               pygame.Rect(8, 8, 14, 14)])
+        self.assertEqual(chained, [pygame.Rect(0, 0, 30, 30)])
+
+
+
+class TestMathUtils(unittest.TestCase):
+    """Test cases for math utilities."""
+    
+    def test_wrap_position_in_place(self):
+        """Test wrap_position writes into out and matches the allocating path."""
+        position = pygame.Vector2(SCREEN_WIDTH + 30, -30)
+        expected = wrap_position(position, SCREEN_WIDTH, SCREEN_HEIGHT, 20)
+        self.assertEqual(expected, pygame.Vector2(-20, SCREEN_HEIGHT + 20))
+        self.assertEqual(position, pygame.Vector2(SCREEN_WIDTH + 30, -30))
+        
+        result = wrap_position(position, SCREEN_WIDTH, SCREEN_HEIGHT, 20, out=position)
+        self.assertIs(result, position)
+        self.assertEqual(position, expected)
+    
+    def test_angle_to_vector_in_place(self):
+        """Test angle_to_vector writes into out and matches the allocating path."""
+        expected = angle_to_vector(30)
+        out = pygame.Vector2()
+        
+        result = angle_to_vector(30, out=out)
+        self.assertIs(result, out)
+        self.assertEqual(out, expected)
+        self.assertAlmostEqual(out.length(), 1.0)
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
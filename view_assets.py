@@ -50,6 +50,21 @@ class AssetViewer:
         self.assets = list(self.asset_manager.images.keys())
         self.selected_asset = 0
         
+        # Rotated previews of each asset, rendered the first time it is selected
+        self.rotation_angles = [0, 45, 90, 135, 180, 225, 270, 315]
+        self.rotated_previews = {}
+        
+        # Static text is rendered once here instead of on every redraw
+        self.instruction_surfaces = self.render_instructions()
+        self.angle_labels = [self.font_small.render(f"{angle}°", True, self.text_color)
+                             for angle in self.rotation_angles]
+        
+        # Card-sized copies of each asset, scaled the first time they are drawn
+        self.thumbnails = {}
+        
+        # The view only changes on input, so frames are drawn only when this is set
+        self.needs_redraw = True
+        
         # Game clock
         self.clock = pygame.time.Clock()
         self.running = True
@@ -62,16 +77,23 @@ class AssetViewer:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.needs_redraw = True
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 elif event.key == pygame.K_LEFT:
                     self.selected_asset = (self.selected_asset - 1) % len(self.assets)
+                    self.needs_redraw = True
                 elif event.key == pygame.K_RIGHT:
                     self.selected_asset = (self.selected_asset + 1) % len(self.assets)
+                    self.needs_redraw = True
                 elif event.key == pygame.K_r:
                     # Reload assets
                     self.asset_manager.reload_assets()
+                    self.rotated_previews.clear()
+                    self.thumbnails.clear()
+                    self.needs_redraw = True
                     print("Assets reloaded!")
                 elif event.key == pygame.K_l:
                     # List assets
@@ -109,16 +131,8 @@ class AssetViewer:
         # Asset image
         image = self.asset_manager.get_image(asset_name)
         if image:
-            # Scale image to fit in card
             img_rect = image.get_rect()
-            max_size = 120
-            
-            if img_rect.width > max_size or img_rect.height > max_size:
-                scale = min(max_size / img_rect.width, max_size / img_rect.height)
-                new_size = (int(img_rect.width * scale), int(img_rect.height * scale))
-                scaled_image = pygame.transform.scale(image, new_size)
-            else:
-                scaled_image = image
+            scaled_image = self.get_thumbnail(asset_name, image)
             
             # Center image in card
             img_x = x + (self.card_width - scaled_image.get_width()) // 2
@@ -138,6 +152,30 @@ class AssetViewer:
         name_y = y + self.card_height - 30
         self.screen.blit(name_surface, (name_x, name_y))
     
+    def get_thumbnail(self, asset_name, image):
+        """Get an asset scaled down to fit in its card."""
+        thumbnail = self.thumbnails.get(asset_name)
+        if thumbnail is None:
+            img_rect = image.get_rect()
+            max_size = 120
+            
+            if img_rect.width > max_size or img_rect.height > max_size:
+                scale = min(max_size / img_rect.width, max_size / img_rect.height)
+                new_size = (int(img_rect.width * scale), int(img_rect.height * scale))
+                thumbnail = pygame.transform.scale(image, new_size)
+            else:
+                thumbnail = image
+            self.thumbnails[asset_name] = thumbnail
+        return thumbnail
+    
+    def get_rotated_previews(self, asset_name, image):
+        """Get the rotated copies of an asset shown in the detailed view."""
+        rotations = self.rotated_previews.get(asset_name)
+        if rotations is None:
+            rotations = [pygame.transform.rotate(image, angle) for angle in self.rotation_angles]
+            self.rotated_previews[asset_name] = rotations
+        return rotations
+    
     def draw_detailed_view(self):
         """Draw detailed view of selected asset."""
         if not self.assets:
@@ -201,18 +239,17 @@ class AssetViewer:
         
         # Rotated previews
         rotation_y = info_y + len(info_lines) * 25
-        for i, angle in enumerate([0, 45, 90, 135, 180, 225, 270, 315]):
-            rotated = pygame.transform.rotate(image, angle)
+        rotations = self.get_rotated_previews(asset_name, image)
+        for i, (rotated, angle_text) in enumerate(zip(rotations, self.angle_labels)):
             rot_x = info_x + i * 60
             self.screen.blit(rotated, (rot_x, rotation_y))
             
             # Angle label
-            angle_text = self.font_small.render(f"{angle}°", True, self.text_color)
             angle_x = rot_x + (rotated.get_width() - angle_text.get_width()) // 2
             self.screen.blit(angle_text, (angle_x, rotation_y + rotated.get_height() + 2))
     
-    def draw_instructions(self):
-        """Draw usage instructions."""
+    def render_instructions(self):
+        """Render the usage instructions once, as (surface, position) pairs."""
         instructions = [
             "Asset Viewer - Asteroids Game",
             "",
@@ -224,6 +261,7 @@ class AssetViewer:
             "ESC : Exit",
         ]
         
+        rendered = []
         y = 20
         for line in instructions:
             if line == instructions[0]:  # Title
@@ -233,8 +271,14 @@ class AssetViewer:
             else:
                 surface = self.font_medium.render(line, True, self.text_color)
             
-            self.screen.blit(surface, (20, y))
+            rendered.append((surface, (20, y)))
             y += 30 if line == instructions[0] else 25
+        return rendered
+    
+    def draw_instructions(self):
+        """Draw usage instructions."""
+        for surface, position in self.instruction_surfaces:
+            self.screen.blit(surface, position)
     
     def render(self):
         """Render the asset viewer."""
@@ -268,7 +312,9 @@ class AssetViewer:
         
         while self.running:
             self.handle_events()
-            self.render()
+            if self.needs_redraw:
+                self.render()
+                self.needs_redraw = False
             self.clock.tick(60)
         
         pygame.quit()